@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Benchmark clean_bible_import_text on a synthetic syllabified corpus.
+
+Known Indonesian text is split into syllable chunks and line-break hyphens
+the way the PDF text layers come out ("ke tu run an", "Naf ta- li"), then
+basic_clean, aggressive_clean, merge_run and clean_text are timed at 1x, 10x
+and 100x of --base-rows. Each stage runs in a fresh process, so neither the
+cleaner's memos nor wordfreq's word cache carry over from an earlier stage
+and peak RSS and timings are comparable across commits:
+
+  python3 scripts/bench_clean_bible_import_text.py --out tmp/bench_clean.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import clean_bible_import_text as cleaner
+
+VOWELS = set("aeiouAEIOU")
+DIGRAPHS = {"ng", "ny", "kh", "sy"}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark clean_bible_import_text on a syllabified corpus.")
+    parser.add_argument(
+        "--source-csv",
+        type=Path,
+        default=Path("docs/import/deuterokanonika_tb1_import_clean_v2.csv"),
+        help="CSV with readable Indonesian text to syllabify.",
+    )
+    parser.add_argument("--out", type=Path, default=Path("tmp/bench_clean_bible_import_text.json"), help="Result JSON path.")
+    parser.add_argument("--base-rows", type=int, default=300, help="Rows in the 1x corpus.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Corpus size multipliers.")
+    parser.add_argument("--seed", type=int, default=20260221, help="Syllabifier random seed.")
+    parser.add_argument("--freq-table", type=Path, default=None, help="Optional zipf table, as in the cleaner.")
+    return parser.parse_args()
+
+
+def syllables(word: str) -> List[str]:
+    """Rough Indonesian syllable split: V-CV, VC-CV, keeping ng/ny/kh/sy together."""
+    parts: List[str] = []
+    start = 0
+    i = 1
+    while i < len(word) - 1:
+        prev_vowel = word[i - 1] in VOWELS
+        if prev_vowel and word[i] not in VOWELS and word[i + 1] in VOWELS:
+            parts.append(word[start:i])
+            start = i
+        elif (
+            prev_vowel
+            and i + 2 < len(word)
+            and word[i] not in VOWELS
+            and word[i + 1] not in VOWELS
+            and word[i + 2] in VOWELS
+        ):
+            cut = i if word[i : i + 2].lower() in DIGRAPHS else i + 1
+            parts.append(word[start:cut])
+            start = cut
+            i = cut
+        i += 1
+    parts.append(word[start:])
+    return [part for part in parts if part]
+
+
+def syllabify_text(text: str, rng: random.Random, split_rate: float = 0.45, hyphen_rate: float = 0.04) -> str:
+    out: List[str] = []
+    for word in text.split():
+        letters = word.strip(",.;:!?\"'()")
+        if len(letters) < 4 or not letters.isalpha() or rng.random() >= split_rate:
+            out.append(word)
+            continue
+        lead = word[: word.index(letters)]
+        tail = word[word.index(letters) + len(letters) :]
+        chunks = [""]
+        for syllable in syllables(letters):
+            if chunks[-1] and rng.random() < 0.6:
+                chunks.append(syllable)
+            else:
+                chunks[-1] += syllable
+        if len(chunks) > 1 and rng.random() < hyphen_rate * 10:
+            cut = rng.randrange(len(chunks) - 1)
+            chunks[cut] += "-"
+        out.append(lead + " ".join(chunks) + tail)
+    return " ".join(out)
+
+
+def build_corpus(source: Sequence[str], rows: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [syllabify_text(source[i % len(source)], rng) for i in range(rows)]
+
+
+def time_calls(fn: Callable[[object], object], inputs: Sequence[object]) -> Dict[str, float]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for item in inputs:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "calls": count,
+        "total_s": round(total, 4),
+        "per_sec": round(count / total, 1) if total else 0.0,
+        "p50_ms": round(latencies[count // 2] * 1000, 4) if count else 0.0,
+        "p99_ms": round(latencies[min(count - 1, int(count * 0.99))] * 1000, 4) if count else 0.0,
+    }
+
+
+SCALE_STAGES = ("basic_clean", "aggressive_clean", "merge_run", "clean_text_safe", "clean_text_aggressive")
+
+
+def prepare_freq_source(freq_table: Optional[Path]) -> str:
+    freq_source = cleaner.configure_freq_source(freq_table)
+    # First lookup loads the wordfreq language lists; keep that out of the
+    # timings. Every word lookup after it still starts uncached.
+    cleaner.token_freq("dan")
+    return freq_source
+
+
+def bench_stage(corpus: List[str], freq_table: Optional[Path], stage: str) -> Dict[str, object]:
+    """Time one stage. Run it through run_isolated so no cache outlives it."""
+    freq_source = prepare_freq_source(freq_table)
+    basic = [cleaner.basic_clean(text)[0] for text in corpus]
+    runs = [match.group(0).split() for text in basic for match in cleaner.WORD_RUN_RE.finditer(text)]
+    fn, inputs = {
+        "basic_clean": (cleaner.basic_clean, corpus),
+        "aggressive_clean": (cleaner.aggressive_clean, basic),
+        "merge_run": (cleaner.merge_run, runs),
+        "clean_text_safe": (lambda text: cleaner.clean_text(text, "safe"), corpus),
+        "clean_text_aggressive": (lambda text: cleaner.clean_text(text, "aggressive"), corpus),
+    }[stage]
+    timings: Dict[str, object] = dict(time_calls(fn, inputs))
+    timings["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"runs": len(runs), "freq_source": freq_source, "timings": timings}
+
+
+def bench_scale(corpus: List[str], freq_table: Optional[Path]) -> Dict[str, object]:
+    # wordfreq keeps its own per-word cache that configure_freq_source()
+    # cannot clear, so each stage gets a fresh process instead.
+    results = {stage: run_isolated(bench_stage, corpus, freq_table, stage) for stage in SCALE_STAGES}
+    stages = {stage: result["timings"] for stage, result in results.items()}
+    first = results[SCALE_STAGES[0]]
+    return {
+        "rows": len(corpus),
+        "runs": first["runs"],
+        "freq_source": first["freq_source"],
+        "stages": stages,
+        "peak_rss_kb": max(timings["peak_rss_kb"] for timings in stages.values()),
+    }
+
+
+def bench_merge_run_shape(
+    corpus: List[str], freq_table: Optional[Path], run_length: int, max_group: Optional[int]
+) -> Dict[str, float]:
+    """Time merge_run on fixed-length runs. Run it through run_isolated."""
+    prepare_freq_source(freq_table)
+    tokens = [token for text in corpus for token in cleaner.basic_clean(text)[0].split() if token.isalpha()]
+    runs = [tokens[i : i + run_length] for i in range(0, len(tokens) - run_length, run_length)][:2000]
+    if max_group is None:
+        return time_calls(cleaner.merge_run, runs)
+    return time_calls(lambda run: cleaner.merge_run(run, max_group), runs)
+
+
+def bench_merge_run_shapes(corpus: List[str], freq_table: Optional[Path]) -> Dict[str, List[Dict[str, float]]]:
+    by_length = [
+        dict(run_isolated(bench_merge_run_shape, corpus, freq_table, length, None), run_length=length)
+        for length in (2, 4, 8, 16, 32)
+    ]
+    by_group = [
+        dict(run_isolated(bench_merge_run_shape, corpus, freq_table, 8, max_group), max_group=max_group)
+        for max_group in (2, 3, 4, 5, 6)
+    ]
+    return {"run_length": by_length, "max_group": by_group}
+
+
+def load_source(path: Path) -> List[str]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return [text for text in ((row.get("text") or "").strip() for row in csv.DictReader(handle)) if text]
+
+
+def git_revision() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except Exception:
+        return ""
+    return result.stdout.strip()
+
+
+def run_isolated(fn: Callable[..., Dict[str, Any]], *args: object) -> Dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def main() -> None:
+    args = parse_args()
+    source = load_source(args.source_csv)
+    if not source:
+        raise SystemExit(f"No text rows in {args.source_csv}")
+
+    scales: List[Dict[str, object]] = []
+    for scale in args.scales:
+        corpus = build_corpus(source, args.base_rows * scale, args.seed)
+        result = bench_scale(corpus, args.freq_table)
+        result["scale"] = scale
+        scales.append(result)
+        print(f"scale {scale}x: {result['stages']['clean_text_aggressive']['per_sec']} aggressive rows/s", file=sys.stderr)
+
+    shapes = bench_merge_run_shapes(build_corpus(source, args.base_rows, args.seed), args.freq_table)
+
+    report = {
+        "meta": {
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "source_csv": str(args.source_csv),
+            "base_rows": args.base_rows,
+            "seed": args.seed,
+        },
+        "scales": scales,
+        "merge_run": shapes,
+    }
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,16 +14,36 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import json
+import os
 import re
-from dataclasses import dataclass
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from heapq import heappush, heappushpop
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:
-    from wordfreq import zipf_frequency  # type: ignore
+    import numpy as np  # type: ignore
 except Exception:
-    zipf_frequency = None
+    np = None
+
+from text_spacing import IMPORT_PUNCTUATION, SPACE_TRANSLATION
+from word_freq_table import ZipfLookup, load_zipf_frequency
+
+# Resolved in main() from --freq-table, wordfreq, or neither (BIBLICAL_WORDS only).
+zipf_frequency: Optional[ZipfLookup] = None
+# The --freq-table argument zipf_frequency was loaded for; forked workers that
+# inherit a matching source keep the parent's warm caches.
+configured_freq_table: Optional[Tuple[Optional[Path]]] = None
+# Set by install_profiler() under --profile; None keeps every stage unwrapped.
+profiler: Optional["StageProfiler"] = None
+# "numpy" solves merge_run for a whole row batch at once; see batch_merge_runs().
+dp_engine = "python"
 
 
 LETTER_CLASS = r"A-Za-zÀ-ÖØ-öø-ÿ"
@@ -31,6 +51,22 @@ WORD_RUN_RE = re.compile(rf"[{LETTER_CLASS}]+(?:\s+[{LETTER_CLASS}]+)+")
 HYPHEN_BREAK_RE = re.compile(rf"([{LETTER_CLASS}])-\s+([{LETTER_CLASS}])")
 MULTISPACE_RE = re.compile(r"\s+")
 
+# Syllables like "ke", "pa", "da" are scored tens of thousands of times per
+# Bible; bound the memo so odd inputs cannot grow it without limit.
+FREQ_CACHE_SIZE = 1 << 18
+# Formulae like "ke pa da" or "Tu han Al lah" repeat across verses; their
+# merge_run result is memoized corpus-wide on the exact token tuple.
+RUN_CACHE_SIZE = 1 << 16
+# Rows whose word runs are segmented together by the numpy DP engine.
+DP_BATCH_ROWS = 256
+# Inputs smaller than this (about a thousand verses) finish before a worker
+# pool has started and loaded its frequency source, so they run serially.
+PARALLEL_MIN_BYTES = 256 * 1024
+PREVIEW_LIMIT = 20
+# Part of every incremental-manifest hash; bump it whenever cleaning rules
+# change so the next --incremental run recomputes every row.
+CLEANER_VERSION = "1"
+
 DO_NOT_JOIN_TWO = {
     "di",
     "ke",
@@ -118,6 +154,25 @@ class CleanStats:
     aggressive_merges: int = 0
     aggressive_mode: bool = False
     wordfreq_available: bool = False
+    freq_source: str = "none"
+    reused_rows: int = 0
+    caches: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    profile: Optional["StageProfiler"] = None
+
+    def merge(self, other: "CleanStats") -> None:
+        self.total_rows += other.total_rows
+        self.changed_rows += other.changed_rows
+        self.changed_text_rows += other.changed_text_rows
+        self.changed_pericope_rows += other.changed_pericope_rows
+        self.hyphen_repairs += other.hyphen_repairs
+        self.aggressive_merges += other.aggressive_merges
+        self.reused_rows += other.reused_rows
+        for name, counters in other.caches.items():
+            merged = self.caches.setdefault(name, {"hits": 0, "misses": 0, "entries": 0, "max_entries": 0})
+            merged["hits"] += counters["hits"]
+            merged["misses"] += counters["misses"]
+            merged["entries"] = max(merged["entries"], counters["entries"])
+            merged["max_entries"] = counters["max_entries"]
 
 
 def parse_args() -> argparse.Namespace:
@@ -136,42 +191,117 @@ def parse_args() -> argparse.Namespace:
         default="safe",
         help="safe=spacing cleanup, aggressive=also syllable-merge.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--freq-table",
+        type=Path,
+        default=None,
+        help="Optional zipf table from word_freq_table.py; used instead of importing wordfreq.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Clean row chunks across N processes (capped at the CPU count); output order matches "
+            "a serial run. Inputs under --parallel-min-bytes are cleaned serially."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=256,
+        help="Rows per worker task when --workers > 1.",
+    )
+    parser.add_argument(
+        "--parallel-min-bytes",
+        type=int,
+        default=PARALLEL_MIN_BYTES,
+        help="Clean serially when the input CSV is smaller than this many bytes, even with --workers > 1.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Keep a per-row hash manifest next to the output and reuse previous output rows whose "
+            "input is unchanged. Changed rows are cleaned in-process, so this cannot be combined "
+            "with --workers."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall time and call counts per cleaning stage in the summary.",
+    )
+    parser.add_argument(
+        "--profile-slowest",
+        type=int,
+        default=10,
+        help=(
+            "With --profile, report this many slowest rows. Under the numpy DP engine a row's time "
+            "includes its share of the batch segmentation (batch_dp_ms)."
+        ),
+    )
+    parser.add_argument(
+        "--dp-engine",
+        choices=("auto", "python", "numpy"),
+        default="python",
+        help=(
+            "Aggressive-mode segmentation DP: python, numpy (batched; needs the optional numpy "
+            "package, see scripts/requirements.txt), or auto (numpy when it is installed). "
+            "scripts/tests/test_batch_merge_runs.py checks that numpy matches python."
+        ),
+    )
+    args = parser.parse_args()
+    if args.incremental and args.workers > 1:
+        parser.error("--incremental cleans changed rows in-process; drop --workers")
+    return args
 
 
 def normalize_spacing(text: str) -> str:
-    cleaned = (
-        text.replace("\r", "")
-        .replace("\u00a0", " ")
-        .replace("\u202f", " ")
-        .replace("\u2009", " ")
-        .replace("\u00ad", "")
-        .replace("ﬁ", "fi")
-        .replace("ﬂ", "fl")
-    )
-    cleaned = MULTISPACE_RE.sub(" ", cleaned).strip()
-    return cleaned
+    return MULTISPACE_RE.sub(" ", text.translate(SPACE_TRANSLATION)).strip()
+
+
+def repair_hyphen_breaks(text: str) -> Tuple[str, int]:
+    return HYPHEN_BREAK_RE.subn(r"\1\2", text)
+
+
+def normalize_punctuation(text: str) -> str:
+    return IMPORT_PUNCTUATION(text)
 
 
 def basic_clean(text: str) -> Tuple[str, int]:
     cleaned = normalize_spacing(text)
 
-    hyphen_count = len(HYPHEN_BREAK_RE.findall(cleaned))
-    cleaned = HYPHEN_BREAK_RE.sub(r"\1\2", cleaned)
+    cleaned, hyphen_count = repair_hyphen_breaks(cleaned)
+    cleaned = normalize_punctuation(cleaned)
+    return cleaned, hyphen_count
 
-    # Punctuation spacing normalization
-    cleaned = re.sub(r"\s+([,.;:!?])", r"\1", cleaned)
-    cleaned = re.sub(r"([(\[{])\s+", r"\1", cleaned)
-    cleaned = re.sub(r"\s+([)\]}])", r"\1", cleaned)
-    cleaned = re.sub(r"\s+(['\"])", r"\1", cleaned)
-    cleaned = re.sub(r"(['\"])\s+", r"\1 ", cleaned)
-    cleaned = MULTISPACE_RE.sub(" ", cleaned).strip()
 
-    return cleaned, hyphen_count
+def configure_freq_source(table_path: Optional[Path]) -> str:
+    global zipf_frequency, configured_freq_table
+    zipf_frequency, source = load_zipf_frequency(table_path)
+    configured_freq_table = (table_path,)
+    _lowered_token_freq.cache_clear()
+    _lowered_merged_word_freq.cache_clear()
+    cached_merge_run.cache_clear()
+    _primed_runs.clear()
+    return source
+
+
+def configure_dp_engine(name: str) -> str:
+    global dp_engine
+    if name == "numpy" and np is None:
+        raise SystemExit("--dp-engine numpy needs numpy installed")
+    dp_engine = "numpy" if name == "numpy" or (name == "auto" and np is not None) else "python"
+    return dp_engine
 
 
 def token_freq(token: str) -> float:
-    t = token.lower()
+    return _lowered_token_freq(token.lower())
+
+
+@lru_cache(maxsize=FREQ_CACHE_SIZE)
+def _lowered_token_freq(t: str) -> float:
     if not t:
         return 0.0
     if zipf_frequency is None:
@@ -189,7 +319,11 @@ def token_freq(token: str) -> float:
 
 
 def merged_word_freq(word: str) -> float:
-    w = word.lower()
+    return _lowered_merged_word_freq(word.lower())
+
+
+@lru_cache(maxsize=FREQ_CACHE_SIZE)
+def _lowered_merged_word_freq(w: str) -> float:
     if not w:
         return 0.0
     freq = token_freq(w)
@@ -198,6 +332,41 @@ def merged_word_freq(word: str) -> float:
     return freq
 
 
+def cache_summary() -> Dict[str, Dict[str, int]]:
+    summary: Dict[str, Dict[str, int]] = {}
+    cached_functions = (
+        ("token_freq", _lowered_token_freq),
+        ("merged_word_freq", _lowered_merged_word_freq),
+        ("merge_run", cached_merge_run),
+    )
+    for name, cached in cached_functions:
+        info = cached.cache_info()
+        summary[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "entries": info.currsize,
+            "max_entries": info.maxsize or 0,
+        }
+    return summary
+
+
+def cache_delta(before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    delta: Dict[str, Dict[str, int]] = {}
+    for name, counters in after.items():
+        delta[name] = dict(counters)
+        delta[name]["hits"] -= before[name]["hits"]
+        delta[name]["misses"] -= before[name]["misses"]
+    return delta
+
+
+def with_hit_rates(caches: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, float]]:
+    report: Dict[str, Dict[str, float]] = {}
+    for name, counters in caches.items():
+        lookups = counters["hits"] + counters["misses"]
+        report[name] = dict(counters, hit_rate=round(counters["hits"] / lookups, 4) if lookups else 0.0)
+    return report
+
+
 def should_allow_group(tokens: Sequence[str]) -> bool:
     if len(tokens) <= 1:
         return True
@@ -286,14 +455,182 @@ def merge_run(tokens: List[str], max_group: int = 4) -> Tuple[str, int]:
     return (" ".join(out_words), merges)
 
 
+def batch_merge_runs(runs: Sequence[Tuple[str, ...]], max_group: int = 4) -> List[Tuple[str, int]]:
+    """
+    merge_run for many runs at once. Runs are bucketed by length and each
+    bucket is solved as arrays: group_score is evaluated for every
+    (run, start, size) with the same float operations in the same order, and
+    the best_score/best_len recurrence advances all runs of the bucket in
+    lockstep from the right, trying sizes in the same order, so ties break
+    identically. Only the frequency lookups stay per string.
+    """
+    buckets: Dict[int, List[int]] = {}
+    for index, run in enumerate(runs):
+        buckets.setdefault(len(run), []).append(index)
+
+    results: List[Tuple[str, int]] = [("", 0)] * len(runs)
+    for n, indexes in buckets.items():
+        bucket = [runs[index] for index in indexes]
+        if n <= 1:
+            solved = [(" ".join(run), 0) for run in bucket]
+        else:
+            solved = _batch_merge_same_length(bucket, n, max_group)
+        for index, result in zip(indexes, solved):
+            results[index] = result
+    return results
+
+
+def _batch_merge_same_length(runs: List[Tuple[str, ...]], n: int, max_group: int) -> List[Tuple[str, int]]:
+    features: Dict[str, Tuple[float, int, bool, bool, bool, bool]] = {}
+    token_rows: List[List[Tuple[float, int, bool, bool, bool, bool]]] = []
+    merged_rows: List[List[float]] = []
+    pad = [(0.0, 0, False, False, False, False)] * max_group
+    for run in runs:
+        row = []
+        for token in run:
+            feature = features.get(token)
+            if feature is None:
+                lowered = token.lower()
+                feature = (
+                    token_freq(token),
+                    len(token),
+                    lowered in PREFIX_TOKENS,
+                    lowered in SUFFIX_TOKENS,
+                    token[:1].isupper(),
+                    lowered in DO_NOT_JOIN_TWO,
+                )
+                features[token] = feature
+            row.append(feature)
+        token_rows.append(row + pad)
+
+        merged_row = [0.0] * (n * max_group)
+        for i in range(n):
+            merged = run[i]
+            no_join = row[i][5]
+            for k in range(2, min(max_group, n - i) + 1):
+                merged += run[i + k - 1]
+                # Look up only groups should_allow_group lets through, as group_score does.
+                if len(merged) > 2 and not (k == 2 and no_join):
+                    merged_row[i * max_group + k - 1] = merged_word_freq(merged)
+        merged_rows.append(merged_row)
+
+    count = len(runs)
+    table = np.array(token_rows, dtype=object)
+    freq = table[:, :, 0].astype(float)
+    size = table[:, :, 1].astype(np.int64)
+    prefix = table[:, :n, 2].astype(bool)
+    suffix = table[:, :, 3].astype(bool)
+    upper = table[:, :n, 4].astype(bool)
+    no_join = table[:, :n, 5].astype(bool)
+    merged_freq = np.array(merged_rows, dtype=float).reshape(count, n, max_group)
+
+    starts = np.arange(n)
+    scores = np.full((count, n, max_group), -10_000.0)
+    scores[:, :, 0] = freq[:, :n]
+
+    part_sum = freq[:, :n].copy()
+    short_count = (size[:, :n] <= 3).astype(np.int64)
+    merged_len = size[:, :n].copy()
+    for k in range(2, max_group + 1):
+        window = slice(k - 1, k - 1 + n)
+        part_sum = part_sum + freq[:, window]
+        short_count = short_count + (size[:, window] <= 3)
+        merged_len = merged_len + size[:, window]
+
+        bonus = 0.5 * (k - 1) + 0.35 * short_count
+        bonus = bonus + np.where(prefix, 0.85, 0.0)
+        bonus = bonus + np.where(suffix[:, window], 1.0, 0.0)
+        bonus = bonus + np.where(upper, 0.45, 0.0)
+        score = merged_freq[:, :, k - 1] + bonus
+
+        allowed = (starts + k <= n) & (merged_len > 2)
+        if k == 2:
+            allowed &= ~no_join
+        allowed &= ~(score < part_sum - 0.1)
+        allowed &= ~(merged_freq[:, :, k - 1] < 1.6)
+        scores[:, :, k - 1] = np.where(allowed, score, -10_000.0)
+
+    best_score = np.full((count, n + 1), -10_000.0)
+    best_score[:, n] = 0.0
+    best_len = np.ones((count, n), dtype=np.int64)
+    for i in range(n - 1, -1, -1):
+        current = best_score[:, i]
+        chosen = best_len[:, i]
+        for k in range(1, min(max_group, n - i) + 1):
+            score = scores[:, i, k - 1]
+            total = score + best_score[:, i + k]
+            better = (score > -9999.0) & (total > current)
+            current[better] = total[better]
+            chosen[better] = k
+
+    results: List[Tuple[str, int]] = []
+    for run, steps in zip(runs, best_len.tolist()):
+        out_words: List[str] = []
+        merges = 0
+        i = 0
+        while i < n:
+            k = steps[i]
+            if k > 1:
+                merges += 1
+            out_words.append(merge_token_group(run[i : i + k]))
+            i += k
+        results.append((" ".join(out_words), merges))
+    return results
+
+
+# merge_run results solved ahead of time by prime_merge_runs(); bounded like
+# the run cache and cleared with it.
+_primed_runs: Dict[Tuple[str, ...], Tuple[str, int]] = {}
+
+
+@lru_cache(maxsize=RUN_CACHE_SIZE)
+def cached_merge_run(tokens: Tuple[str, ...]) -> Tuple[str, int]:
+    primed = _primed_runs.get(tokens)
+    if primed is not None:
+        return primed
+    return merge_run(list(tokens))
+
+
+# basic_clean() of a row's text and pericope, as prime_merge_runs() passes them on.
+BasicCleaned = Tuple[Tuple[str, int], Tuple[str, int]]
+
+
+def prime_merge_runs(rows: Iterable[Dict[str, str]]) -> Iterator[Tuple[Dict[str, str], BasicCleaned]]:
+    """
+    Pass rows through with their basic_clean()ed text and pericope, segmenting
+    each batch's new word runs in one batch_merge_runs call first.
+    """
+    for chunk in iter_chunks(rows, DP_BATCH_ROWS):
+        # New run -> index of the first row in the chunk that needs it.
+        pending: Dict[Tuple[str, ...], int] = {}
+        cleaned: List[BasicCleaned] = []
+        for index, row in enumerate(chunk):
+            cleaned.append(
+                (basic_clean((row.get("text") or "").strip()), basic_clean((row.get("pericope") or "").strip()))
+            )
+            for base, _ in cleaned[-1]:
+                for match in WORD_RUN_RE.finditer(base):
+                    tokens = tuple(match.group(0).split())
+                    if tokens not in _primed_runs:
+                        pending.setdefault(tokens, index)
+        if pending:
+            if len(_primed_runs) + len(pending) > RUN_CACHE_SIZE:
+                _primed_runs.clear()
+            batch = list(pending)
+            started = time.perf_counter()
+            _primed_runs.update(zip(batch, batch_merge_runs(batch)))
+            if profiler is not None:
+                profiler.charge_batch(chunk, pending, time.perf_counter() - started)
+        yield from zip(chunk, cleaned)
+
+
 def aggressive_clean(text: str) -> Tuple[str, int]:
     total_merges = 0
 
     def replace_run(match: re.Match[str]) -> str:
         nonlocal total_merges
         run = match.group(0)
-        words = run.split()
-        merged_run, merges = merge_run(words)
+        merged_run, merges = cached_merge_run(tuple(run.split()))
         total_merges += merges
         return merged_run
 
@@ -304,6 +641,11 @@ def aggressive_clean(text: str) -> Tuple[str, int]:
 
 def clean_text(text: str, mode: str) -> Tuple[str, int, int]:
     base, hyphen_repairs = basic_clean(text)
+    return finish_clean_text(base, hyphen_repairs, mode)
+
+
+def finish_clean_text(base: str, hyphen_repairs: int, mode: str) -> Tuple[str, int, int]:
+    """clean_text() for text that has already been through basic_clean()."""
     if mode != "aggressive":
         return base, hyphen_repairs, 0
 
@@ -311,80 +653,436 @@ def clean_text(text: str, mode: str) -> Tuple[str, int, int]:
     return merged, hyphen_repairs, merge_count
 
 
-def load_rows(path: Path) -> List[Dict[str, str]]:
+# (stage name, module function) pairs timed under --profile. The functions are
+# looked up as module globals at call time, so rebinding them is the whole hook.
+PROFILED_STAGES = (
+    ("normalize_spacing", "normalize_spacing"),
+    ("hyphen_repair", "repair_hyphen_breaks"),
+    ("punctuation", "normalize_punctuation"),
+    ("merge_run", "merge_run"),
+    ("batch_merge_runs", "batch_merge_runs"),
+    ("clean_row", "clean_row"),
+)
+_UNPROFILED: Dict[str, Callable[..., Any]] = {}
+
+
+class StageProfiler:
+    def __init__(self, slowest: int) -> None:
+        self.slowest = slowest
+        self.stages: Dict[str, List[float]] = {}
+        # (seconds, batch seconds, book, chapter, verse); seconds includes the batch share.
+        self.slowest_rows: List[Tuple[float, float, str, str, str]] = []
+        # id(row) -> that row's share of a batch_merge_runs call, until the row is cleaned.
+        self.batch_shares: Dict[int, float] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        totals = self.stages.get(stage)
+        if totals is None:
+            self.stages[stage] = [seconds, 1]
+        else:
+            totals[0] += seconds
+            totals[1] += 1
+
+    def record_row(self, seconds: float, row: Dict[str, str], batch_seconds: float = 0.0) -> None:
+        if self.slowest <= 0:
+            return
+        entry = (seconds, batch_seconds, row.get("book_name") or "", row.get("chapter") or "", row.get("verse") or "")
+        if len(self.slowest_rows) < self.slowest:
+            heappush(self.slowest_rows, entry)
+        elif entry > self.slowest_rows[0]:
+            heappushpop(self.slowest_rows, entry)
+
+    def charge_batch(self, rows: Sequence[Dict[str, str]], runs: Dict[Tuple[str, ...], int], seconds: float) -> None:
+        """Split one batch DP call over the rows whose runs it solved, by token count."""
+        weights = [0] * len(rows)
+        for tokens, index in runs.items():
+            weights[index] += len(tokens)
+        total = sum(weights)
+        for row, weight in zip(rows, weights):
+            if weight:
+                self.batch_shares[id(row)] = seconds * weight / total
+
+    def wrap(self, stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - started)
+
+        return timed
+
+    def wrap_row(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(fn)
+        def timed(row: Dict[str, str], *args: Any) -> Any:
+            started = time.perf_counter()
+            out = fn(row, *args)
+            elapsed = time.perf_counter() - started
+            self.record("clean_row", elapsed)
+            batch_seconds = self.batch_shares.pop(id(row), 0.0)
+            self.record_row(elapsed + batch_seconds, row, batch_seconds)
+            return out
+
+        return timed
+
+    def timed_iter(self, stage: str, items: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
+        iterator = iter(items)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.record(stage, time.perf_counter() - started)
+            yield item
+
+    def merge(self, other: "StageProfiler") -> None:
+        for stage, (seconds, calls) in other.stages.items():
+            totals = self.stages.setdefault(stage, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += calls
+        for entry in other.slowest_rows:
+            self.record_row(entry[0], {"book_name": entry[2], "chapter": entry[3], "verse": entry[4]}, entry[1])
+
+    def take(self) -> "StageProfiler":
+        """Return the data recorded so far and start over, for per-chunk reports."""
+        taken = StageProfiler(self.slowest)
+        taken.stages, self.stages = self.stages, {}
+        taken.slowest_rows, self.slowest_rows = self.slowest_rows, []
+        return taken
+
+    def report(self, wall_seconds: float) -> Dict[str, Any]:
+        return {
+            "wall_seconds": round(wall_seconds, 4),
+            "stages": {
+                stage: {
+                    "calls": int(calls),
+                    "seconds": round(seconds, 4),
+                    "mean_ms": round(seconds * 1000 / calls, 4) if calls else 0.0,
+                }
+                for stage, (seconds, calls) in sorted(self.stages.items(), key=lambda item: -item[1][0])
+            },
+            "slowest_rows": [
+                {
+                    "book": book,
+                    "chapter": chapter,
+                    "verse": verse,
+                    "ms": round(seconds * 1000, 3),
+                    "batch_dp_ms": round(batch_seconds * 1000, 3),
+                }
+                for seconds, batch_seconds, book, chapter, verse in sorted(self.slowest_rows, reverse=True)
+            ],
+        }
+
+
+def install_profiler(slowest: int) -> StageProfiler:
+    global profiler
+    profiler = StageProfiler(slowest)
+    module = globals()
+    for stage, name in PROFILED_STAGES:
+        original = _UNPROFILED.setdefault(name, module[name])
+        module[name] = profiler.wrap_row(original) if stage == "clean_row" else profiler.wrap(stage, original)
+    return profiler
+
+
+def init_worker(freq_table: Optional[Path], engine: str, profile_slowest: Optional[int]) -> None:
+    # Under fork the source is already loaded and warmed by the parent;
+    # reloading it would throw that away. Spawned workers start unconfigured.
+    if configured_freq_table != (freq_table,):
+        configure_freq_source(freq_table)
+    configure_dp_engine(engine)
+    if profile_slowest is not None:
+        install_profiler(profile_slowest)
+
+
+def iter_rows(path: Path) -> Iterator[Dict[str, str]]:
     with path.open("r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return [dict(row) for row in reader]
+        for row in csv.DictReader(handle):
+            yield dict(row)
 
 
-def write_rows(path: Path, rows: List[Dict[str, str]]) -> None:
+def write_rows(path: Path, rows: Iterable[Dict[str, str]], profile: Optional["StageProfiler"] = None) -> None:
+    # Rows may still be streaming from the input file, which can be the same
+    # path, so write beside the output and swap it in once complete.
     path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = ["book_name", "grouping", "order_index", "chapter", "verse", "text", "pericope"]
-    with path.open("w", newline="", encoding="utf-8") as handle:
+    partial = path.with_name(path.name + ".partial")
+    with partial.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
+        if profile is not None:
+            writer.writerow = profile.wrap("csv_write", writer.writerow)  # type: ignore[method-assign]
         for row in rows:
             writer.writerow({key: row.get(key, "") for key in fieldnames})
-
-
-def summarize_preview(before_rows: List[Dict[str, str]], after_rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    os.replace(partial, path)
+
+
+def collect_preview(examples: List[Dict[str, str]], before: Dict[str, str], after: Dict[str, str]) -> None:
+    if len(examples) >= PREVIEW_LIMIT:
+        return
+    b = (before.get("text") or "").strip()
+    a = (after.get("text") or "").strip()
+    if b and a and b != a:
+        examples.append(
+            {
+                "book": before.get("book_name", ""),
+                "chapter": before.get("chapter", ""),
+                "verse": before.get("verse", ""),
+                "before": b[:240],
+                "after": a[:240],
+            }
+        )
+
+
+def tally_changes(stats: CleanStats, row: Dict[str, str], out: Dict[str, str]) -> None:
+    stats.total_rows += 1
+    text_changed = (row.get("text") or "").strip() != out["text"]
+    pericope_changed = (row.get("pericope") or "").strip() != out["pericope"]
+    if text_changed:
+        stats.changed_text_rows += 1
+    if pericope_changed:
+        stats.changed_pericope_rows += 1
+    if text_changed or pericope_changed:
+        stats.changed_rows += 1
+
+
+def clean_row(
+    row: Dict[str, str], mode: str, stats: CleanStats, cleaned: Optional[BasicCleaned] = None
+) -> Dict[str, str]:
+    out = dict(row)
+
+    if cleaned is None:
+        cleaned = (basic_clean((row.get("text") or "").strip()), basic_clean((row.get("pericope") or "").strip()))
+    (text_base, text_hyphens), (pericope_base, pericope_hyphens) = cleaned
+    new_text, hyphens_text, merges_text = finish_clean_text(text_base, text_hyphens, mode)
+    new_pericope, hyphens_peri, merges_peri = finish_clean_text(pericope_base, pericope_hyphens, mode)
+
+    stats.hyphen_repairs += hyphens_text + hyphens_peri
+    stats.aggressive_merges += merges_text + merges_peri
+
+    out["text"] = new_text
+    out["pericope"] = new_pericope
+    tally_changes(stats, row, out)
+    return out
+
+
+def clean_rows(
+    rows: Iterable[Dict[str, str]],
+    mode: str,
+    stats: CleanStats,
+    examples: List[Dict[str, str]],
+) -> Iterator[Dict[str, str]]:
+    if mode == "aggressive" and dp_engine == "numpy":
+        # Priming already ran basic_clean(); clean_row() picks up from there.
+        for row, cleaned in prime_merge_runs(rows):
+            out = clean_row(row, mode, stats, cleaned)
+            collect_preview(examples, row, out)
+            yield out
+        return
+    for row in rows:
+        out = clean_row(row, mode, stats)
+        collect_preview(examples, row, out)
+        yield out
+
+
+def clean_chunk(rows: List[Dict[str, str]], mode: str) -> Tuple[List[Dict[str, str]], CleanStats, List[Dict[str, str]]]:
+    stats = CleanStats()
     examples: List[Dict[str, str]] = []
-    for before, after in zip(before_rows, after_rows):
-        b = (before.get("text") or "").strip()
-        a = (after.get("text") or "").strip()
-        if b and a and b != a:
-            examples.append(
-                {
-                    "book": before.get("book_name", ""),
-                    "chapter": before.get("chapter", ""),
-                    "verse": before.get("verse", ""),
-                    "before": b[:240],
-                    "after": a[:240],
-                }
-            )
-        if len(examples) >= 20:
-            break
-    return examples
+    before = cache_summary()
+    out_rows = list(clean_rows(rows, mode, stats, examples))
+    stats.caches = cache_delta(before, cache_summary())
+    if profiler is not None:
+        stats.profile = profiler.take()
+    return out_rows, stats, examples
+
+
+def iter_chunks(rows: Iterable[Dict[str, str]], size: int) -> Iterator[List[Dict[str, str]]]:
+    chunk: List[Dict[str, str]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def clean_rows_parallel(
+    rows: Iterable[Dict[str, str]],
+    mode: str,
+    stats: CleanStats,
+    examples: List[Dict[str, str]],
+    workers: int,
+    chunk_size: int,
+    freq_table: Optional[Path],
+    profile_slowest: Optional[int] = None,
+) -> Iterator[Dict[str, str]]:
+    # Chunks are collected strictly in submission order, so the output and
+    # the merged stats/examples match a serial run. Only a few chunks per
+    # worker are in flight, which keeps memory flat like the serial stream.
+    # wordfreq loads its language lists lazily; load them once here so forked
+    # workers inherit them instead of each paying for the load.
+    token_freq("dan")
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(freq_table, dp_engine, profile_slowest)
+    ) as pool:
+        pending: deque[Future] = deque()
+
+        def drain_one() -> Iterator[Dict[str, str]]:
+            out_rows, chunk_stats, chunk_examples = pending.popleft().result()
+            stats.merge(chunk_stats)
+            if profiler is not None and chunk_stats.profile is not None:
+                profiler.merge(chunk_stats.profile)
+            examples.extend(chunk_examples[: max(0, PREVIEW_LIMIT - len(examples))])
+            yield from out_rows
+
+        for chunk in iter_chunks(rows, chunk_size):
+            pending.append(pool.submit(clean_chunk, chunk, mode))
+            if len(pending) >= workers * 2:
+                yield from drain_one()
+        while pending:
+            yield from drain_one()
+
+
+def manifest_path(output_csv: Path) -> Path:
+    return output_csv.with_name(output_csv.name + ".manifest.tsv")
+
+
+def row_key(row: Dict[str, str], seen: Counter[str]) -> str:
+    base = "|".join((row.get("book_name") or "", row.get("chapter") or "", row.get("verse") or ""))
+    seen[base] += 1
+    return f"{base}#{seen[base]}"
+
+
+def freq_source_digest(table_path: Optional[Path]) -> str:
+    # Rebuilding --freq-table can change how any row is cleaned, so its
+    # contents are part of every row hash, not just the source name.
+    if table_path is None:
+        return ""
+    return hashlib.blake2b(table_path.read_bytes(), digest_size=12).hexdigest()
+
+
+def row_digest(row: Dict[str, str], salt: str) -> str:
+    payload = "\0".join((salt, row.get("text") or "", row.get("pericope") or ""))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def load_incremental_state(output_csv: Path) -> Tuple[Dict[str, Tuple[str, int, int]], Dict[str, Dict[str, str]]]:
+    path = manifest_path(output_csv)
+    if not path.exists() or not output_csv.exists():
+        return {}, {}
+
+    manifest: Dict[str, Tuple[str, int, int]] = {}
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        for key, digest, hyphens, merges in csv.reader(handle, delimiter="\t"):
+            manifest[key] = (digest, int(hyphens), int(merges))
+
+    previous: Dict[str, Dict[str, str]] = {}
+    seen: Counter[str] = Counter()
+    for row in iter_rows(output_csv):
+        previous[row_key(row, seen)] = row
+    return manifest, previous
+
+
+def clean_rows_incremental(
+    rows: Iterable[Dict[str, str]],
+    mode: str,
+    stats: CleanStats,
+    examples: List[Dict[str, str]],
+    salt: str,
+    manifest: Dict[str, Tuple[str, int, int]],
+    previous: Dict[str, Dict[str, str]],
+    manifest_writer: Any,
+) -> Iterator[Dict[str, str]]:
+    seen: Counter[str] = Counter()
+    for row in rows:
+        key = row_key(row, seen)
+        digest = row_digest(row, salt)
+        saved = manifest.get(key)
+        reused = previous.get(key)
+        hyphens_before = stats.hyphen_repairs
+        merges_before = stats.aggressive_merges
+
+        if saved is not None and saved[0] == digest and reused is not None:
+            out = dict(row)
+            out["text"] = reused.get("text") or ""
+            out["pericope"] = reused.get("pericope") or ""
+            stats.hyphen_repairs += saved[1]
+            stats.aggressive_merges += saved[2]
+            stats.reused_rows += 1
+            tally_changes(stats, row, out)
+        else:
+            out = clean_row(row, mode, stats)
+
+        manifest_writer.writerow(
+            [key, digest, stats.hyphen_repairs - hyphens_before, stats.aggressive_merges - merges_before]
+        )
+        collect_preview(examples, row, out)
+        yield out
 
 
 def main() -> None:
     args = parse_args()
-    source_rows = load_rows(args.input_csv)
-    output_rows: List[Dict[str, str]] = []
-
-    stats = CleanStats(aggressive_mode=args.mode == "aggressive", wordfreq_available=zipf_frequency is not None)
-
-    for row in source_rows:
-        stats.total_rows += 1
-        out = dict(row)
-
-        old_text = (row.get("text") or "").strip()
-        old_pericope = (row.get("pericope") or "").strip()
-
-        new_text, hyphens_text, merges_text = clean_text(old_text, args.mode)
-        new_pericope, hyphens_peri, merges_peri = clean_text(old_pericope, args.mode)
-
-        stats.hyphen_repairs += hyphens_text + hyphens_peri
-        stats.aggressive_merges += merges_text + merges_peri
-
-        out["text"] = new_text
-        out["pericope"] = new_pericope
-        output_rows.append(out)
-
-        text_changed = old_text != new_text
-        pericope_changed = old_pericope != new_pericope
-        if text_changed:
-            stats.changed_text_rows += 1
-        if pericope_changed:
-            stats.changed_pericope_rows += 1
-        if text_changed or pericope_changed:
-            stats.changed_rows += 1
+    started = time.perf_counter()
+    freq_source = configure_freq_source(args.freq_table)
+    configure_dp_engine(args.dp_engine)
+    profile = install_profiler(args.profile_slowest) if args.profile else None
+
+    stats = CleanStats(
+        aggressive_mode=args.mode == "aggressive",
+        wordfreq_available=zipf_frequency is not None,
+        freq_source=freq_source,
+    )
+    examples: List[Dict[str, str]] = []
 
-    write_rows(args.output_csv, output_rows)
+    # Rows are read, cleaned and written one at a time so memory stays flat
+    # regardless of how many translations the CSV carries.
+    rows: Iterable[Dict[str, str]] = iter_rows(args.input_csv)
+    if profile is not None:
+        rows = profile.timed_iter("csv_read", rows)
+    workers = min(args.workers, os.cpu_count() or 1)
+    if args.input_csv.stat().st_size < args.parallel_min_bytes:
+        workers = 1
+    manifest_file = manifest_path(args.output_csv)
+    if args.incremental:
+        # Load the previous run before write_rows replaces its output.
+        manifest, previous = load_incremental_state(args.output_csv)
+        salt = "\0".join((CLEANER_VERSION, args.mode, freq_source, freq_source_digest(args.freq_table)))
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        partial_manifest = manifest_file.with_name(manifest_file.name + ".partial")
+        with partial_manifest.open("w", newline="", encoding="utf-8") as handle:
+            manifest_writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+            cleaned = clean_rows_incremental(
+                rows, args.mode, stats, examples, salt, manifest, previous, manifest_writer
+            )
+            write_rows(args.output_csv, cleaned, profile)
+        os.replace(partial_manifest, manifest_file)
+        stats.caches = cache_summary()
+    elif workers > 1:
+        cleaned = clean_rows_parallel(
+            rows,
+            args.mode,
+            stats,
+            examples,
+            workers,
+            max(1, args.chunk_size),
+            args.freq_table,
+            args.profile_slowest if profile is not None else None,
+        )
+        write_rows(args.output_csv, cleaned, profile)
+    else:
+        write_rows(args.output_csv, clean_rows(rows, args.mode, stats, examples), profile)
+        stats.caches = cache_summary()
+    if not args.incremental:
+        # A full run rewrote the output, so an old manifest no longer describes it.
+        manifest_file.unlink(missing_ok=True)
 
     summary = {
         "mode": args.mode,
         "wordfreq_available": stats.wordfreq_available,
+        "freq_source": stats.freq_source,
+        "dp_engine": dp_engine,
         "rows": {
             "total": stats.total_rows,
             "changed": stats.changed_rows,
@@ -395,9 +1093,17 @@ def main() -> None:
             "hyphen_repairs": stats.hyphen_repairs,
             "aggressive_merges": stats.aggressive_merges,
         },
-        "examples": summarize_preview(source_rows, output_rows),
+        "incremental": {
+            "enabled": args.incremental,
+            "reused_rows": stats.reused_rows,
+            "recomputed_rows": stats.total_rows - stats.reused_rows,
+        },
+        "caches": with_hit_rates(stats.caches),
+        "examples": examples,
         "output_csv": str(args.output_csv),
     }
+    if profile is not None:
+        summary["profile"] = profile.report(time.perf_counter() - started)
 
     if args.summary_json is not None:
         args.summary_json.parent.mkdir(parents=True, exist_ok=True)
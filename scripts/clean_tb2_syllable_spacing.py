@@ -16,13 +16,26 @@ from __future__ import annotations
 import argparse
 import csv
 import difflib
+import hashlib
+import itertools
 import json
 import math
+import os
+import pickle
 import re
+import struct
+import sys
+import time
+from bisect import bisect_right
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from letter_alignment import ENGINES as ALIGN_ENGINES
+from letter_alignment import align_letters, blocks_mapping, diff_blocks, edit_budget, letter_blocks
+from text_spacing import REFERENCE_PUNCTUATION, TB2_PUNCTUATION, TYPOGRAPHIC_TRANSLATION
 
 try:
     from wordfreq import zipf_frequency  # type: ignore
@@ -33,21 +46,23 @@ except Exception:
 LETTER_CLASS = r"A-Za-zÀ-ÖØ-öø-ÿ"
 WORD_TOKEN_RE = re.compile(rf"[{LETTER_CLASS}-]+")
 VALID_HYPHEN_WORD_RE = re.compile(rf"[{LETTER_CLASS}]+(?:-[{LETTER_CLASS}]+)+")
-TOKEN_RE = re.compile(rf"[{LETTER_CLASS}-]+|[^{LETTER_CLASS}-]+")
 WORD_RUN_RE = re.compile(rf"[{LETTER_CLASS}-]+(?:\s+[{LETTER_CLASS}-]+)+")
 SHORT_RUN_RE = re.compile(r"(?:\b[\wÀ-ÿ]{1,3}\b\s+){2,}\b[\wÀ-ÿ]{1,3}\b")
 MULTISPACE_RE = re.compile(r"\s+")
+PHRASE_WORD_RE = re.compile(r"\w+")
+# Tokenizer for remove_cross_reference_noise; the group names are the token
+# kinds before book names and bare numbers are checked (see reference_tokens).
 REFERENCE_TOKEN_RE = re.compile(
-    rf"""\s+|"""
-    rf"""\d{{1,3}}:\d{{1,3}}(?:-\d{{1,3}}(?::\d{{1,3}})?)?|"""
-    rf"""\d{{1,3}}-\d{{1,3}}|"""
-    rf"""(?:[1-3]?)[{LETTER_CLASS}]+\.?|"""
-    rf"""\d+|"""
-    rf"""[;,.:!?()\[\]"'/-]|."""
+    rf"""(?P<space>\s+)|"""
+    rf"""(?P<ref>\d{{1,3}}:\d{{1,3}}(?:-\d{{1,3}}(?::\d{{1,3}})?)?)|"""
+    rf"""(?P<cont>\d{{1,3}}-\d{{1,3}})|"""
+    rf"""(?P<word>(?:[1-3]?)[{LETTER_CLASS}]+\.?)|"""
+    rf"""(?P<number>\d+)|"""
+    rf"""(?P<sep>[;,.:!?()\[\]"'/-])|"""
+    rf"""(?P<other>.)"""
 )
-CITATION_REF_RE = re.compile(r"^\d{1,3}:\d{1,3}(?:-\d{1,3}(?::\d{1,3})?)?$")
-CITATION_CONT_RE = re.compile(r"^\d{1,3}(?:-\d{1,3})?$")
-CITATION_BOOK_TOKEN_RE = re.compile(rf"^(?:[1-3]?)[{LETTER_CLASS}]+\.?$")
+# Every "ref" token, parenthesized reference and malformed head contains one.
+REFERENCE_HINT_RE = re.compile(r"\d:\d")
 REFERENCE_PARENS_RE = re.compile(
     rf"""
     \(
@@ -62,6 +77,13 @@ REFERENCE_PARENS_RE = re.compile(
 )
 MALFORMED_HEAD_REF_RE = re.compile(rf"\b\d{{1,3}}:\d{{1,3}}:\s*[1-3]?[{LETTER_CLASS}]{{2,24}}\.?")
 
+# TB1 reference cache: header (magic, version, sha256 of the TB1 CSV), then a
+# pickle of plain dicts/tuples. Bump the version whenever index_tb1_rows or
+# build_tb1_lexicon change what they produce.
+TB1_CACHE_MAGIC = b"TB1C"
+TB1_CACHE_VERSION = 3
+TB1_CACHE_HEADER = struct.Struct("<4sH32s")
+
 REFERENCE_BOOK_ABBRS = {
     "Kej",
     "Kel",
@@ -174,89 +196,153 @@ DO_NOT_JOIN_TWO = {
 
 SUFFIX_TOKENS = {"lah", "kah", "pun", "nya", "ku", "mu"}
 
-# Curated high-confidence fixes for split tokens still found after alignment.
-STATIC_SAFE_PHRASE_FIXES: List[Tuple[re.Pattern[str], str]] = [
-    (re.compile(r"\bkemu\s+di\s+an\b", re.IGNORECASE), "kemudian"),
-    (re.compile(r"\bya\s+hu\s+di\b", re.IGNORECASE), "yahudi"),
-    (re.compile(r"\bber\s+di\s+ri\b", re.IGNORECASE), "berdiri"),
-    (re.compile(r"\bmemberi\s+tahu\s+kan\b", re.IGNORECASE), "memberitahukan"),
-    (re.compile(r"\bper\s+buat\s+an\b", re.IGNORECASE), "perbuatan"),
-    (re.compile(r"\bpeng\s+lihat\s+an\b", re.IGNORECASE), "penglihatan"),
-    (re.compile(r"\bke\s+raja\s+an\b", re.IGNORECASE), "kerajaan"),
-    (re.compile(r"\bke\s+tetap\s+an\b", re.IGNORECASE), "ketetapan"),
-    (re.compile(r"\bme\s+laku\s+kan\b", re.IGNORECASE), "melakukan"),
-    (re.compile(r"\bke\s+kuasa\s+an\b", re.IGNORECASE), "kekuasaan"),
-    (re.compile(r"\bper\s+kata\s+an\b", re.IGNORECASE), "perkataan"),
-    (re.compile(r"\bke\s+mulia\s+an\b", re.IGNORECASE), "kemuliaan"),
-    (re.compile(r"\bke\s+kuat\s+an\b", re.IGNORECASE), "kekuatan"),
-    (re.compile(r"\bper\s+api\s+an\b", re.IGNORECASE), "perapian"),
-    (re.compile(r"\bke\s+turun\s+an\b", re.IGNORECASE), "keturunan"),
-    (re.compile(r"\bdi\s+beri\s+kan\b", re.IGNORECASE), "diberikan"),
-    (re.compile(r"\bdi\s+laku\s+kan\b", re.IGNORECASE), "dilakukan"),
-    (re.compile(r"\bke\s+ada\s+an\b", re.IGNORECASE), "keadaan"),
-    (re.compile(r"\bke\s+gelap\s+an\b", re.IGNORECASE), "kegelapan"),
-    (re.compile(r"\bme\s+si\s+as\b", re.IGNORECASE), "mesias"),
-    (re.compile(r"\bke\s+benar\s+an\b", re.IGNORECASE), "kebenaran"),
-    (re.compile(r"\bme\s+lepas\s+kan\b", re.IGNORECASE), "melepaskan"),
-    (re.compile(r"\bme\s+me\s+gang\b", re.IGNORECASE), "memegang"),
-    (re.compile(r"\bse\s+per\s+tiga\b", re.IGNORECASE), "sepertiga"),
-    (re.compile(r"\bke\s+raja\s+annya\b", re.IGNORECASE), "kerajaannya"),
-    (re.compile(r"\bke\s+pada\s+nya\b", re.IGNORECASE), "kepadanya"),
-    (re.compile(r"\bke\s+pada\b", re.IGNORECASE), "kepada"),
-    (re.compile(r"\bdi\s+ri\b", re.IGNORECASE), "diri"),
-    (re.compile(r"\bme\s+lihat\b", re.IGNORECASE), "melihat"),
-    (re.compile(r"\bke\s+dua\b", re.IGNORECASE), "kedua"),
-    (re.compile(r"\bbah\s+kan\b", re.IGNORECASE), "bahkan"),
-    (re.compile(r"\bper\s+buat\b", re.IGNORECASE), "perbuat"),
-    (re.compile(r"\blaku\s+kan\b", re.IGNORECASE), "lakukan"),
-    (re.compile(r"\bdemi\s+kian\b", re.IGNORECASE), "demikian"),
-    (re.compile(r"\bdemi\s+kianlah\b", re.IGNORECASE), "demikianlah"),
-    (re.compile(r"\bke\s+padaku\b", re.IGNORECASE), "kepadaku"),
-    (re.compile(r"\bke\s+padamu\b", re.IGNORECASE), "kepadamu"),
-    (re.compile(r"\bke\s+padanya\b", re.IGNORECASE), "kepadanya"),
-    (re.compile(r"\bsi\s+apa\b", re.IGNORECASE), "siapa"),
-    (re.compile(r"\bke\s+empat\b", re.IGNORECASE), "keempat"),
-    (re.compile(r"\bdi\s+beri\b", re.IGNORECASE), "diberi"),
-    (re.compile(r"\bper\s+nah\b", re.IGNORECASE), "pernah"),
-    (re.compile(r"\bme\s+lawan\b", re.IGNORECASE), "melawan"),
-    (re.compile(r"\bke\s+tiga\b", re.IGNORECASE), "ketiga"),
-    (re.compile(r"\bberi\s+kan\b", re.IGNORECASE), "berikan"),
-    (re.compile(r"\bmendengar\s+kan\b", re.IGNORECASE), "mendengarkan"),
-    (re.compile(r"\bpa\s+da\b", re.IGNORECASE), "pada"),
-    (re.compile(r"\bha\s+ri\b", re.IGNORECASE), "hari"),
-    (re.compile(r"\bja\s+di\b", re.IGNORECASE), "jadi"),
-    (re.compile(r"\bpada\s+nya\b", re.IGNORECASE), "padanya"),
-    (re.compile(r"\bpengajar\s+an\b", re.IGNORECASE), "pengajaran"),
-    (re.compile(r"\bapi\s+an\b", re.IGNORECASE), "apian"),
-    (re.compile(r"\bdi\s+rinya\b", re.IGNORECASE), "dirinya"),
-    (re.compile(r"\bter\s+tulis\b", re.IGNORECASE), "tertulis"),
-    (re.compile(r"\bdi\s+bawa\b", re.IGNORECASE), "dibawa"),
-    (re.compile(r"\bkata\s+kan\b", re.IGNORECASE), "katakan"),
-    (re.compile(r"\bnyata\s+kan\b", re.IGNORECASE), "nyatakan"),
-    (re.compile(r"\bbuat\s+an\b", re.IGNORECASE), "buatan"),
-    (re.compile(r"\bter\s+jadi\b", re.IGNORECASE), "terjadi"),
-    (re.compile(r"\bpemerintah\s+an\b", re.IGNORECASE), "pemerintahan"),
-    (re.compile(r"\bsem\s+bah\b", re.IGNORECASE), "sembah"),
-    (re.compile(r"\bsem\s+bah\s+an\b", re.IGNORECASE), "sembahan"),
-    (re.compile(r"\bper\s+sem\s+bah\s+kan\b", re.IGNORECASE), "persembahkan"),
-    (re.compile(r"\bper\s+sem\s+bah\s+an\b", re.IGNORECASE), "persembahan"),
-    (re.compile(r"\bmen\s+diri\s+kan\b", re.IGNORECASE), "mendirikan"),
-    (re.compile(r"\bka\s+re\s+na\b", re.IGNORECASE), "karena"),
-    (re.compile(r"\bsau\s+da\s+ra\b", re.IGNORECASE), "saudara"),
-    (re.compile(r"\bdi\s+taruh\b", re.IGNORECASE), "ditaruh"),
-    (re.compile(r"\bme\s+lahir\s+kan\b", re.IGNORECASE), "melahirkan"),
-    (re.compile(r"\bke\s+dengar\s+an\b", re.IGNORECASE), "kedengaran"),
-    (re.compile(r"\bke\s+pedih\s+an\b", re.IGNORECASE), "kepedihan"),
-    (re.compile(r"\bme\s+minta\b", re.IGNORECASE), "meminta"),
-    (re.compile(r"\bdi\s+tumpas\b", re.IGNORECASE), "ditumpas"),
+# Chapter streams run to tens of thousands of letters, so --alignment chapter
+# allows far fewer edits than a single verse gets. It is meant for renumbered
+# chapters with the same wording; chapters further apart than this are aligned
+# verse by verse instead.
+CHAPTER_EDIT_FRACTION = 0.05
+
+# Curated high-confidence fixes for split tokens still found after alignment:
+# (whitespace-separated words, matched case-insensitively as whole words;
+# replacement). Earlier rules take precedence; see PhraseRewriter.
+STATIC_SAFE_PHRASE_FIXES: List[Tuple[str, str]] = [
+    ("kemu di an", "kemudian"),
+    ("ya hu di", "yahudi"),
+    ("ber di ri", "berdiri"),
+    ("memberi tahu kan", "memberitahukan"),
+    ("per buat an", "perbuatan"),
+    ("peng lihat an", "penglihatan"),
+    ("ke raja an", "kerajaan"),
+    ("ke tetap an", "ketetapan"),
+    ("me laku kan", "melakukan"),
+    ("ke kuasa an", "kekuasaan"),
+    ("per kata an", "perkataan"),
+    ("ke mulia an", "kemuliaan"),
+    ("ke kuat an", "kekuatan"),
+    ("per api an", "perapian"),
+    ("ke turun an", "keturunan"),
+    ("di beri kan", "diberikan"),
+    ("di laku kan", "dilakukan"),
+    ("ke ada an", "keadaan"),
+    ("ke gelap an", "kegelapan"),
+    ("me si as", "mesias"),
+    ("ke benar an", "kebenaran"),
+    ("me lepas kan", "melepaskan"),
+    ("me me gang", "memegang"),
+    ("se per tiga", "sepertiga"),
+    ("ke raja annya", "kerajaannya"),
+    ("ke pada nya", "kepadanya"),
+    ("ke pada", "kepada"),
+    ("di ri", "diri"),
+    ("me lihat", "melihat"),
+    ("ke dua", "kedua"),
+    ("bah kan", "bahkan"),
+    ("per buat", "perbuat"),
+    ("laku kan", "lakukan"),
+    ("demi kian", "demikian"),
+    ("demi kianlah", "demikianlah"),
+    ("ke padaku", "kepadaku"),
+    ("ke padamu", "kepadamu"),
+    ("ke padanya", "kepadanya"),
+    ("si apa", "siapa"),
+    ("ke empat", "keempat"),
+    ("di beri", "diberi"),
+    ("per nah", "pernah"),
+    ("me lawan", "melawan"),
+    ("ke tiga", "ketiga"),
+    ("beri kan", "berikan"),
+    ("mendengar kan", "mendengarkan"),
+    ("pa da", "pada"),
+    ("ha ri", "hari"),
+    ("ja di", "jadi"),
+    ("pada nya", "padanya"),
+    ("pengajar an", "pengajaran"),
+    ("api an", "apian"),
+    ("di rinya", "dirinya"),
+    ("ter tulis", "tertulis"),
+    ("di bawa", "dibawa"),
+    ("kata kan", "katakan"),
+    ("nyata kan", "nyatakan"),
+    ("buat an", "buatan"),
+    ("ter jadi", "terjadi"),
+    ("pemerintah an", "pemerintahan"),
+    ("sem bah", "sembah"),
+    ("sem bah an", "sembahan"),
+    ("per sem bah kan", "persembahkan"),
+    ("per sem bah an", "persembahan"),
+    ("men diri kan", "mendirikan"),
+    ("ka re na", "karena"),
+    ("sau da ra", "saudara"),
+    ("di taruh", "ditaruh"),
+    ("me lahir kan", "melahirkan"),
+    ("ke dengar an", "kedengaran"),
+    ("ke pedih an", "kepedihan"),
+    ("me minta", "meminta"),
+    ("di tumpas", "ditumpas"),
 ]
 
 
+@dataclass
+class TokenStream:
+    # A text's words as offsets: letters is the lowercased letters of every
+    # word, concatenated; word i spans text[word_starts[i]:word_ends[i]] and
+    # its letters end at letters offset boundaries[i].
+    text: str
+    letters: str
+    word_starts: List[int]
+    word_ends: List[int]
+    boundaries: List[int]
+
+    def inner_boundaries(self) -> set[int]:
+        """Letter offsets where one word ends and the next begins."""
+        return set(self.boundaries[:-1])
+
+
 @dataclass
 class RowRef:
     verse: int
     text: str
     normalized: str
+    # Reference side of project_boundaries, built once per TB1 row.
+    stream: TokenStream
+    boundaries: set[int]
+    letter_counts: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class ChapterAlignment:
+    # Letter stream of all TB2 verse texts in a chapter, mapped onto the
+    # stream of all TB1 verse texts of that chapter in verse order.
+    mapping: List[Optional[int]]
+    ref_boundaries: set[int]
+    ref_offsets: List[int]
+    ref_rows: List[RowRef]
+
+
+@dataclass
+class AlignSettings:
+    min_direct_ratio: float
+    min_neighbor_ratio: float
+    neighbor_window: int
+    align_engine: str
+    fast_path: bool = True
+    fast_path_check: bool = False
+
+
+@dataclass
+class RowPlan:
+    # Reference choice for one TB2 row, before any text is rewritten.
+    source_text: str
+    source_pericope: str
+    method: str
+    confidence: float
+    ref: Optional[RowRef]
+    direct_ref: Optional[RowRef]
+    chapter_text: Optional[str] = None
+    # Text already has TB1's boundaries; projecting it would change nothing.
+    fast_path: bool = False
+    # TB1 heading the TB2 pericope is aligned against (see choose_pericope_reference).
+    pericope_ref: Optional[RowRef] = None
 
 
 @dataclass
@@ -269,6 +355,22 @@ class Stats:
     low_confidence_rows: int = 0
     short_runs_before: int = 0
     short_runs_after: int = 0
+    rows_alignment_chapter: int = 0
+    neighbor_candidates: int = 0
+    neighbor_pruned_length: int = 0
+    neighbor_pruned_letters: int = 0
+    rows_fast_path: int = 0
+    pericopes_heading_aligned: int = 0
+    pericopes_unmatched: int = 0
+    chapters_over_edit_budget: int = 0
+    fast_path_mismatches: int = 0
+    fast_path_mismatch_examples: List[Dict[str, str]] = field(default_factory=list)
+    # Phrase -> number of STATIC_SAFE_PHRASE_FIXES replacements made.
+    phrase_fixes: Counter[str] = field(default_factory=Counter)
+
+    def merge(self, other: "Stats") -> None:
+        for counter in fields(self):
+            setattr(self, counter.name, getattr(self, counter.name) + getattr(other, counter.name))
 
 
 def parse_args() -> argparse.Namespace:
@@ -321,6 +423,84 @@ def parse_args() -> argparse.Namespace:
         default=30,
         help="Max changed examples in summary.",
     )
+    parser.add_argument(
+        "--tb1-cache",
+        type=Path,
+        default=Path("tmp/tb1_reference_cache.bin"),
+        help="Cache of the TB1 index and lexicon, rebuilt whenever the TB1 CSV content changes.",
+    )
+    parser.add_argument(
+        "--no-tb1-cache",
+        action="store_true",
+        help="Always rebuild the TB1 index and lexicon from the CSV.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Clean book/chapter shards across N processes; output and summary match a serial run.",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help=(
+            "Evaluate every combination of --sweep-direct/--sweep-neighbor/--sweep-window (each defaults "
+            "to the single setting) from ratios computed once per verse; writes only --sweep-json."
+        ),
+    )
+    parser.add_argument(
+        "--sweep-json",
+        type=Path,
+        default=Path("tmp/tb2_threshold_sweep.json"),
+        help="Where --sweep writes its results; kept apart from --summary-json.",
+    )
+    parser.add_argument("--sweep-direct", type=float, nargs="+", default=None, help="--min-direct-ratio values to sweep.")
+    parser.add_argument("--sweep-neighbor", type=float, nargs="+", default=None, help="--min-neighbor-ratio values to sweep.")
+    parser.add_argument("--sweep-window", type=int, nargs="+", default=None, help="--neighbor-window values to sweep.")
+    parser.add_argument(
+        "--align-engine",
+        choices=ALIGN_ENGINES,
+        default="difflib",
+        help=(
+            "Letter-stream aligner for boundary projection: difflib (the reference) or anchors (difflib's "
+            "blocks, with longest matches found from shared letter runs; faster on long or noisy verses)."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=25,
+        help=(
+            "Write a resume checkpoint after every N book/chapter shards. The CSV is streamed to "
+            "<out-csv>.partial and moved into place when the run completes."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from <out-csv>.checkpoint.json; the final output matches an uninterrupted run.",
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help="Align every row, even rows whose letters and word boundaries already match the TB1 verse.",
+    )
+    parser.add_argument(
+        "--fast-path-check",
+        action="store_true",
+        help="Also run the full alignment for fast-path rows and report any row whose output differs.",
+    )
+    parser.add_argument(
+        "--alignment",
+        choices=("verse", "chapter"),
+        default="verse",
+        help=(
+            "verse: pick a TB1 verse per TB2 verse (same or nearby) and align the pair. "
+            "chapter: align each whole TB2 chapter against the TB1 chapter once and slice the "
+            "mapping per verse, which absorbs verse numbering shifts. Chapters too far apart "
+            "for that are aligned verse by verse."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -329,66 +509,28 @@ def normalize_letters(text: str) -> str:
 
 
 def normalize_spacing(text: str) -> str:
-    text = (
-        text.replace("\r", "")
-        .replace("\u00a0", " ")
-        .replace("\u202f", " ")
-        .replace("\u2009", " ")
-        .replace("”", '"')
-        .replace("“", '"')
-        .replace("’", "'")
-        .replace("‘", "'")
-        .replace("—", "-")
-        .replace("–", "-")
-        .replace("\u00ad", "")
-        .replace("ﬁ", "fi")
-        .replace("ﬂ", "fl")
-    )
-    text = MULTISPACE_RE.sub(" ", text).strip()
-    return text
+    return MULTISPACE_RE.sub(" ", text.translate(TYPOGRAPHIC_TRANSLATION)).strip()
 
 
 def normalize_punctuation_spacing(text: str) -> str:
-    text = normalize_spacing(text)
-    text = re.sub(r"\s+([,.;:!?])", r"\1", text)
-    text = re.sub(r"([(\[{])\s+", r"\1", text)
-    text = re.sub(r"\s+([)\]}])", r"\1", text)
-    text = re.sub(r"\s+(['\"])", r"\1", text)
-    text = re.sub(r":([\"'])", r": \1", text)
-    text = re.sub(r"(['\"])\s+", r"\1 ", text)
-    text = MULTISPACE_RE.sub(" ", text).strip()
-    return text
-
-
-def split_tokens(text: str) -> List[str]:
-    return TOKEN_RE.findall(text)
-
-
-def is_word_token(token: str) -> bool:
-    return bool(WORD_TOKEN_RE.fullmatch(token))
-
-
-def word_norm(word: str) -> str:
-    return re.sub(rf"[^{LETTER_CLASS}]", "", word).lower()
+    return TB2_PUNCTUATION(text.translate(TYPOGRAPHIC_TRANSLATION))
 
 
-def build_stream(text: str) -> Tuple[List[str], List[int], List[str], List[int], str, set[int]]:
-    tokens = split_tokens(text)
-    word_indexes: List[int] = []
-    words: List[str] = []
-    for idx, token in enumerate(tokens):
-        if is_word_token(token):
-            word_indexes.append(idx)
-            words.append(token)
-
-    stream = ""
+def build_stream(text: str) -> TokenStream:
+    words = [match.span() for match in WORD_TOKEN_RE.finditer(text)]
     boundaries: List[int] = []
-    for word in words:
-        stream += word_norm(word)
-        boundaries.append(len(stream))
-
-    boundary_set = set(boundaries[:-1])
-    return tokens, word_indexes, words, boundaries, stream, boundary_set
+    offset = 0
+    for start, end in words:
+        # Word tokens are letters and hyphens; the stream keeps the letters.
+        offset += end - start - text.count("-", start, end)
+        boundaries.append(offset)
+    return TokenStream(
+        text=text,
+        letters=normalize_letters(text),
+        word_starts=[start for start, _ in words],
+        word_ends=[end for _, end in words],
+        boundaries=boundaries,
+    )
 
 
 def sequence_ratio(a: str, b: str) -> float:
@@ -397,6 +539,20 @@ def sequence_ratio(a: str, b: str) -> float:
     return difflib.SequenceMatcher(a=a, b=b, autojunk=False).ratio()
 
 
+def length_ratio_bound(len_a: int, len_b: int) -> float:
+    # SequenceMatcher.real_quick_ratio(): matches cannot exceed the shorter side.
+    total = len_a + len_b
+    return 2.0 * min(len_a, len_b) / total if total else 0.0
+
+
+def letter_ratio_bound(counts_a: Counter[str], counts_b: Counter[str], total: int) -> float:
+    # SequenceMatcher.quick_ratio(): matches cannot exceed the shared letter multiset.
+    if not total:
+        return 0.0
+    shared = sum(min(count, counts_b[letter]) for letter, count in counts_a.items())
+    return 2.0 * shared / total
+
+
 def choose_reference(
     tb2_norm: str,
     ref_rows: Dict[int, RowRef],
@@ -404,15 +560,29 @@ def choose_reference(
     min_direct_ratio: float,
     min_neighbor_ratio: float,
     neighbor_window: int,
+    stats: Optional[Stats] = None,
+    ratio_cache: Optional[Dict[int, float]] = None,
 ) -> Tuple[Optional[RowRef], str, float]:
+    def ratio_to(candidate: RowRef) -> float:
+        if ratio_cache is None:
+            return sequence_ratio(tb2_norm, candidate.normalized)
+        ratio = ratio_cache.get(candidate.verse)
+        if ratio is None:
+            ratio = ratio_cache[candidate.verse] = sequence_ratio(tb2_norm, candidate.normalized)
+        return ratio
+
     direct_ref = ref_rows.get(verse)
     best_ref = direct_ref
-    best_ratio = sequence_ratio(tb2_norm, direct_ref.normalized) if direct_ref else 0.0
+    best_ratio = ratio_to(direct_ref) if direct_ref else 0.0
     best_mode = "same"
 
     if best_ratio >= min_direct_ratio and direct_ref is not None:
         return direct_ref, best_mode, best_ratio
 
+    # Neighbors only win with a strictly higher ratio, so a candidate whose
+    # upper bound cannot beat the best so far is skipped without running
+    # difflib; the chosen reference and reported ratio are unchanged.
+    tb2_counts: Optional[Counter[str]] = None
     low = max(1, verse - neighbor_window)
     high = verse + neighbor_window
     for candidate_verse in range(low, high + 1):
@@ -421,7 +591,20 @@ def choose_reference(
         candidate = ref_rows.get(candidate_verse)
         if candidate is None:
             continue
-        ratio = sequence_ratio(tb2_norm, candidate.normalized)
+        if stats is not None:
+            stats.neighbor_candidates += 1
+        if length_ratio_bound(len(tb2_norm), len(candidate.normalized)) <= best_ratio:
+            if stats is not None:
+                stats.neighbor_pruned_length += 1
+            continue
+        if tb2_counts is None:
+            tb2_counts = Counter(tb2_norm)
+        total = len(tb2_norm) + len(candidate.normalized)
+        if letter_ratio_bound(tb2_counts, candidate.letter_counts, total) <= best_ratio:
+            if stats is not None:
+                stats.neighbor_pruned_letters += 1
+            continue
+        ratio = ratio_to(candidate)
         if ratio > best_ratio:
             best_ratio = ratio
             best_ref = candidate
@@ -435,22 +618,49 @@ def choose_reference(
     return None, "none", best_ratio
 
 
-def project_boundaries(tb2_text: str, ref_text: str) -> str:
-    tokens2, word_idx2, words2, boundaries2, stream2, _ = build_stream(tb2_text)
-    _, _, _, _, stream_ref, ref_boundaries = build_stream(ref_text)
+def matches_reference_boundaries(text: str, text_norm: str, ref: RowRef) -> bool:
+    """
+    True when text has the same letters as ref and each of its word
+    boundaries is also one of ref's: the alignment is then the identity and
+    project_boundaries(text, ref.text) keeps every space, returning text.
+    """
+    if not text_norm or text_norm != ref.normalized:
+        return False
+    return build_stream(text).inner_boundaries() <= ref.boundaries
+
+
+def project_boundaries(tb2_text: str, ref_text: str, engine: str = "difflib") -> str:
+    stream_ref = build_stream(ref_text)
+    return project_onto_stream(tb2_text, stream_ref, stream_ref.inner_boundaries(), engine)
 
-    if not stream2 or not stream_ref or not words2:
-        return tb2_text
 
-    matcher = difflib.SequenceMatcher(a=stream2, b=stream_ref, autojunk=False)
-    map_stream2_to_ref: List[Optional[int]] = [None] * len(stream2)
+def project_onto_stream(
+    tb2_text: str, stream_ref: TokenStream, ref_boundaries: set[int], engine: str = "difflib"
+) -> str:
+    """project_boundaries() against an already built reference stream, e.g. RowRef.stream."""
+    stream2 = build_stream(tb2_text)
 
-    for block in matcher.get_matching_blocks():
-        for offset in range(block.size):
-            map_stream2_to_ref[block.a + offset] = block.b + offset
+    if not stream2.letters or not stream_ref.letters or not stream2.word_starts:
+        return tb2_text
 
-    keep_space_after_word = [True] * (len(words2) - 1)
-    for i in range(len(words2) - 1):
+    map_stream2_to_ref = align_letters(stream2.letters, stream_ref.letters, engine)
+    return apply_boundary_map(stream2, map_stream2_to_ref, ref_boundaries)
+
+
+def apply_boundary_map(
+    stream2: TokenStream,
+    map_stream2_to_ref: Sequence[Optional[int]],
+    ref_boundaries: set[int],
+) -> str:
+    """
+    Join TB2 words whose boundary has no TB1 counterpart. A joined group is
+    written as its words run together followed by the non-whitespace gaps
+    that sat between them; the rest of the text is copied unchanged.
+    """
+    boundaries2 = stream2.boundaries
+    word_count = len(boundaries2)
+    keep_space_after_word = [True] * (word_count - 1)
+    for i in range(word_count - 1):
         boundary = boundaries2[i]
         ref_boundary: Optional[int] = None
         if boundary - 1 >= 0 and map_stream2_to_ref[boundary - 1] is not None:
@@ -459,29 +669,93 @@ def project_boundaries(tb2_text: str, ref_text: str) -> str:
             ref_boundary = map_stream2_to_ref[boundary]
         keep_space_after_word[i] = ref_boundary in ref_boundaries if ref_boundary is not None else True
 
-    out_tokens = tokens2[:]
+    text = stream2.text
+    starts = stream2.word_starts
+    ends = stream2.word_ends
+    pieces: List[str] = []
+    cursor = 0
     wi = 0
-    while wi < len(words2):
-        merged = words2[wi]
+    while wi < word_count:
         wj = wi
-        while wj < len(words2) - 1 and not keep_space_after_word[wj]:
-            merged += words2[wj + 1]
+        while wj < word_count - 1 and not keep_space_after_word[wj]:
             wj += 1
-
-        out_tokens[word_idx2[wi]] = merged
-        for kill in range(wi + 1, wj + 1):
-            out_tokens[word_idx2[kill]] = ""
-
-        for k in range(wi, wj):
-            left = word_idx2[k]
-            right = word_idx2[k + 1]
-            for token_i in range(left + 1, right):
-                if out_tokens[token_i].isspace():
-                    out_tokens[token_i] = ""
-
+        if wj > wi:
+            pieces.append(text[cursor : starts[wi]])
+            pieces.extend(text[starts[k] : ends[k]] for k in range(wi, wj + 1))
+            for k in range(wi, wj):
+                gap = text[ends[k] : starts[k + 1]]
+                if not gap.isspace():
+                    pieces.append(gap)
+            cursor = ends[wj]
         wi = wj + 1
-
-    return "".join(out_tokens)
+    if not pieces:
+        return text
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+def align_chapter(
+    tb2_texts: List[str], ref_rows: Dict[int, RowRef], engine: str
+) -> Optional[Tuple[ChapterAlignment, List[int]]]:
+    """
+    Align a TB2 chapter in one pass; returns the alignment and each TB2
+    text's stream offset, or None when the chapters need more edits than
+    CHAPTER_EDIT_FRACTION allows.
+    """
+    offsets: List[int] = []
+    letters: List[str] = []
+    length = 0
+    for text in tb2_texts:
+        offsets.append(length)
+        letters.append(normalize_letters(text))
+        length += len(letters[-1])
+    stream2 = "".join(letters)
+
+    ordered = [ref_rows[verse] for verse in sorted(ref_rows)]
+    ref_offsets: List[int] = []
+    ref_boundaries: set[int] = set()
+    ref_letters: List[str] = []
+    length = 0
+    for ref in ordered:
+        ref_offsets.append(length)
+        # Every TB1 word end is a boundary here, verse ends included: the
+        # next verse's first word follows it in the chapter stream.
+        ref_boundaries.update(length + boundary for boundary in ref.stream.boundaries)
+        ref_letters.append(ref.normalized)
+        length += len(ref.normalized)
+    stream_ref = "".join(ref_letters)
+
+    mapping: List[Optional[int]] = [None] * len(stream2)
+    if stream2 and stream_ref:
+        # The bounded diff is cheap on close chapters and gives up early on
+        # divergent ones, so it gates every engine; the engine then aligns.
+        if diff_blocks(stream2, stream_ref, edit_budget(stream2, stream_ref, CHAPTER_EDIT_FRACTION)) is None:
+            return None
+        mapping = blocks_mapping(letter_blocks(stream2, stream_ref, engine), len(stream2))
+    return ChapterAlignment(mapping, ref_boundaries, ref_offsets, ordered), offsets
+
+
+def project_chapter_boundaries(
+    tb2_text: str, alignment: ChapterAlignment, offset: int
+) -> Tuple[str, Optional[RowRef], float]:
+    """
+    Project one verse through its chapter alignment. Returns the text, the TB1
+    verse most of it landed in, and a ratio in the spirit of
+    SequenceMatcher.ratio(): matched letters against the verse plus the TB1
+    span they cover.
+    """
+    stream2 = build_stream(tb2_text)
+    mapping = alignment.mapping[offset : offset + len(stream2.letters)]
+    matched = [position for position in mapping if position is not None]
+    if not stream2.word_starts or not matched:
+        return tb2_text, None, 0.0
+
+    span = matched[-1] - matched[0] + 1
+    ratio = 2.0 * len(matched) / (len(stream2.letters) + span)
+    median = matched[len(matched) // 2]
+    ref = alignment.ref_rows[bisect_right(alignment.ref_offsets, median) - 1]
+    text = apply_boundary_map(stream2, mapping, alignment.ref_boundaries)
+    return text, ref, ratio
 
 
 def build_tb1_lexicon(tb1_rows: List[Dict[str, str]]) -> Tuple[Counter[str], Dict[str, str]]:
@@ -537,32 +811,59 @@ def token_score(token: str, lexicon: Counter[str]) -> float:
     return -2.5
 
 
-def fallback_group_score(tokens: Sequence[str], lexicon: Counter[str]) -> float:
-    if len(tokens) == 1:
-        return token_score(tokens[0], lexicon)
-
-    first = tokens[0].lower()
-    if len(tokens) == 2 and first in DO_NOT_JOIN_TWO:
-        merged = "".join(tokens).lower()
-        if lexicon.get(merged, 0) == 0:
+class FallbackScorer:
+    """
+    Memoized scores for the fallback segmentation DP. Every TB1 lexicon form
+    is scored up front; other forms are scored (via zipf bands when wordfreq
+    is available) the first time they are seen, and whole windows of
+    lowercased words are memoized too, so the syllable runs that recur across
+    low-confidence verses are scored once per process. Scores are the same
+    floats token_score() gives.
+    """
+
+    def __init__(self, lexicon: Counter[str]) -> None:
+        self.lexicon = lexicon
+        self.tokens: Dict[str, float] = {form: token_score(form, lexicon) for form in lexicon}
+        self.groups: Dict[Tuple[str, ...], float] = {}
+
+    def token_score(self, lowered: str) -> float:
+        score = self.tokens.get(lowered)
+        if score is None:
+            score = self.tokens[lowered] = token_score(lowered, self.lexicon)
+        return score
+
+    def group_score(self, parts: Tuple[str, ...]) -> float:
+        """Score of merging lowercased parts into one word; -9999.0 when they must stay apart."""
+        score = self.groups.get(parts)
+        if score is None:
+            score = self.groups[parts] = self._group_score(parts)
+        return score
+
+    def _group_score(self, parts: Tuple[str, ...]) -> float:
+        if len(parts) == 1:
+            return self.token_score(parts[0])
+
+        merged = "".join(parts)
+        if len(parts) == 2 and parts[0] in DO_NOT_JOIN_TWO:
+            if self.lexicon.get(merged, 0) == 0:
+                return -9999.0
+
+        merged_score = self.token_score(merged)
+        split_score = sum(self.token_score(part) for part in parts)
+
+        if merged_score + 0.8 * (len(parts) - 1) < split_score - 0.2:
             return -9999.0
-
-    merged = "".join(tokens)
-    merged_score = token_score(merged, lexicon)
-    split_score = sum(token_score(part, lexicon) for part in tokens)
-
-    if merged_score + 0.8 * (len(tokens) - 1) < split_score - 0.2:
-        return -9999.0
-    if merged_score < 0.5:
-        return -9999.0
-    return merged_score + 0.8 * (len(tokens) - 1)
+        if merged_score < 0.5:
+            return -9999.0
+        return merged_score + 0.8 * (len(parts) - 1)
 
 
-def fallback_merge_words(words: List[str], lexicon: Counter[str], max_group: int = 5) -> str:
+def fallback_merge_words(words: List[str], scorer: FallbackScorer, max_group: int = 5) -> str:
     n = len(words)
     if n <= 1:
         return " ".join(words)
 
+    lowered = [word.lower() for word in words]
     best_score = [-10_000.0] * (n + 1)
     best_len = [1] * n
     best_score[n] = 0.0
@@ -570,8 +871,7 @@ def fallback_merge_words(words: List[str], lexicon: Counter[str], max_group: int
     for i in range(n - 1, -1, -1):
         upper = min(max_group, n - i)
         for k in range(1, upper + 1):
-            chunk = words[i : i + k]
-            score = fallback_group_score(chunk, lexicon)
+            score = scorer.group_score(tuple(lowered[i : i + k]))
             if score <= -9990.0:
                 continue
             total = score + best_score[i + k]
@@ -588,10 +888,10 @@ def fallback_merge_words(words: List[str], lexicon: Counter[str], max_group: int
     return " ".join(out)
 
 
-def fallback_clean_text(text: str, lexicon: Counter[str]) -> str:
+def fallback_clean_text(text: str, scorer: FallbackScorer) -> str:
     def repl(match: re.Match[str]) -> str:
         words = match.group(0).split()
-        return fallback_merge_words(words, lexicon)
+        return fallback_merge_words(words, scorer)
 
     return WORD_RUN_RE.sub(repl, text)
 
@@ -623,105 +923,186 @@ def restore_hyphen_forms(text: str, hyphen_lookup: Dict[str, str]) -> str:
     return re.sub(rf"\b[{LETTER_CLASS}]{{5,}}\b", repl, text)
 
 
-def apply_static_safe_phrase_fixes(text: str) -> str:
-    fixed = text
-    for _ in range(4):
-        prev = fixed
-        for pattern, replacement in STATIC_SAFE_PHRASE_FIXES:
-            fixed = pattern.sub(replacement, fixed)
-        if fixed == prev:
-            break
-    return fixed
+# Characters that re.IGNORECASE matches against ASCII letters but that
+# str.lower() does not map onto them.
+PHRASE_FOLD_TRANSLATION = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+class PhraseRewriter:
+    r"""
+    Phrase rules, each one regex r"\bw1\s+w2...\b" (case-insensitive), applied
+    in list order and repeated up to max_passes times until nothing changes.
+
+    A trie over the rules' folded words finds every rule that can match in a
+    single scan of the text's word tokens, so a pass costs one scan however
+    many rules there are, and only rules with a candidate match run their
+    regex. Whenever a rule rewrites the text the scan is redone, so later
+    rules in the same pass see the rewritten text exactly as they would when
+    every regex ran in sequence.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], max_passes: int = 4) -> None:
+        self.rules = list(rules)
+        self.max_passes = max_passes
+        self.patterns = [
+            re.compile(r"\b" + r"\s+".join(re.escape(word) for word in phrase.split()) + r"\b", re.IGNORECASE)
+            for phrase, _ in self.rules
+        ]
+        # word -> (children, indexes of rules whose phrase ends at this word)
+        self.trie: Dict[str, Tuple[Dict, List[int]]] = {}
+        for index, (phrase, _) in enumerate(self.rules):
+            node = self.trie
+            words = phrase.split()
+            for depth, word in enumerate(words):
+                children, ends = node.setdefault(self.fold(word), ({}, []))
+                if depth == len(words) - 1:
+                    ends.append(index)
+                node = children
+
+    @staticmethod
+    def fold(word: str) -> str:
+        return word.translate(PHRASE_FOLD_TRANSLATION).lower()
+
+    def candidates(self, text: str) -> List[int]:
+        """Sorted indexes of the rules that may match text (a superset of those that do)."""
+        tokens = [(match.start(), match.end(), self.fold(match.group())) for match in PHRASE_WORD_RE.finditer(text)]
+        found: set[int] = set()
+        for first in range(len(tokens)):
+            node = self.trie
+            position = first
+            while True:
+                entry = node.get(tokens[position][2])
+                if entry is None:
+                    break
+                node, ends = entry
+                found.update(ends)
+                position += 1
+                if not node or position == len(tokens):
+                    break
+                if not text[tokens[position - 1][1] : tokens[position][0]].isspace():
+                    break
+        return sorted(found)
+
+    def __call__(self, text: str, fired: Optional[Counter[str]] = None) -> str:
+        fixed = text
+        for _ in range(self.max_passes):
+            prev = fixed
+            pending = self.candidates(fixed)
+            while pending:
+                index = pending[0]
+                fixed, count = self.patterns[index].subn(self.rules[index][1], fixed)
+                if count:
+                    if fired is not None:
+                        fired[self.rules[index][0]] += count
+                    pending = [later for later in self.candidates(fixed) if later > index]
+                else:
+                    pending = pending[1:]
+            if fixed == prev:
+                break
+        return fixed
 
 
-def is_reference_book_token(token: str) -> bool:
-    if not CITATION_BOOK_TOKEN_RE.fullmatch(token):
-        return False
-    return token.rstrip(".") in REFERENCE_BOOK_ABBRS
+SAFE_PHRASE_REWRITER = PhraseRewriter(STATIC_SAFE_PHRASE_FIXES)
 
 
-def remove_cross_reference_noise(text: str) -> str:
-    tokens = REFERENCE_TOKEN_RE.findall(text)
-    if not tokens:
-        return text
+def apply_static_safe_phrase_fixes(text: str, fired: Optional[Counter[str]] = None) -> str:
+    return SAFE_PHRASE_REWRITER(text, fired)
 
-    remove = [False] * len(tokens)
-    separators = {",", ";", ":", ".", "!", "?", "(", ")", "[", "]", '"', "'", "/", "-"}
 
+def reference_tokens(text: str) -> List[Tuple[str, str]]:
+    """
+    (kind, token) pairs covering text. Kinds: "space", "ref" (1:2, 1:2-3,
+    1:2-3:4), "book" (a REFERENCE_BOOK_ABBRS name, optionally with a period),
+    "cont" (a 1-3 digit number or range), "sep" (punctuation) and "other".
+    """
+    tokens: List[Tuple[str, str]] = []
+    for match in REFERENCE_TOKEN_RE.finditer(text):
+        token = match.group()
+        kind = match.lastgroup or "other"
+        if kind == "word":
+            kind = "book" if token.rstrip(".") in REFERENCE_BOOK_ABBRS else "other"
+        elif kind == "number":
+            kind = "cont" if len(token) <= 3 else "other"
+        tokens.append((kind, token))
+    return tokens
+
+
+def looks_like_reference(refs: int, books: int, conts: int, seps: int) -> bool:
+    nonspace = refs + books + conts + seps
+    return (
+        (refs >= 2 and (books >= 1 or conts >= 1))
+        or (books >= 1 and refs >= 1 and seps >= 1 and nonspace >= 5)
+        or refs >= 3
+    )
+
+
+def remove_cross_reference_noise(text: str) -> str:
+    """
+    Drop cross-reference lists ("Kej 1:2; 3:4-5, Kel 2:1") left in the text.
+
+    A candidate span starts at a ref or book token and runs up to the next
+    "other" token; it is dropped when looks_like_reference() accepts its
+    token counts. Those tests only grow with the span, so when the span from
+    the first ref/book token of a run is rejected, every later start in that
+    run is too, and one pass over the tokens decides the whole text. The
+    pass also records whether the kept text can still contain a "(...)"
+    reference or a malformed "1:2:Kej" head, so those regexes only run then.
+    Text without any chapter:verse pair has nothing to drop and skips the scan.
+    """
+    if not REFERENCE_HINT_RE.search(text):
+        return REFERENCE_PUNCTUATION(text)
+    tokens = reference_tokens(text)
+    kept: List[str] = []
+    colons = 0
+    has_paren = False
+    total = len(tokens)
     i = 0
-    while i < len(tokens):
-        token = tokens[i]
-        if token.isspace():
-            i += 1
-            continue
-        if not (CITATION_REF_RE.fullmatch(token) or is_reference_book_token(token) or CITATION_CONT_RE.fullmatch(token)):
+    while i < total:
+        kind, token = tokens[i]
+        if kind != "ref" and kind != "book":
+            kept.append(token)
+            if kind == "sep":
+                if token == ":":
+                    colons += 1
+                elif token == "(":
+                    has_paren = True
             i += 1
             continue
 
+        refs = books = conts = seps = 0
         j = i
-        ref_count = 0
-        book_count = 0
-        cont_count = 0
-        sep_count = 0
-        nonspace_count = 0
-        prev_kind = ""
-
-        while j < len(tokens):
-            current = tokens[j]
-            if current.isspace():
-                j += 1
-                continue
-            if CITATION_REF_RE.fullmatch(current):
-                ref_count += 1
-                nonspace_count += 1
-                prev_kind = "ref"
-                j += 1
-                continue
-            if is_reference_book_token(current):
-                book_count += 1
-                nonspace_count += 1
-                prev_kind = "book"
-                j += 1
-                continue
-            if current in separators:
-                sep_count += 1
-                nonspace_count += 1
-                prev_kind = "sep"
-                j += 1
-                continue
-            if CITATION_CONT_RE.fullmatch(current):
-                if prev_kind in {"sep", "ref", "book", "cont"}:
-                    cont_count += 1
-                    nonspace_count += 1
-                    prev_kind = "cont"
-                    j += 1
-                    continue
+        while j < total:
+            span_kind = tokens[j][0]
+            if span_kind == "ref":
+                refs += 1
+            elif span_kind == "book":
+                books += 1
+            elif span_kind == "cont":
+                conts += 1
+            elif span_kind == "sep":
+                seps += 1
+            elif span_kind != "space":
                 break
-            break
-
-        looks_like_reference = (
-            (ref_count >= 2 and (book_count >= 1 or cont_count >= 1))
-            or (book_count >= 1 and ref_count >= 1 and sep_count >= 1 and nonspace_count >= 5)
-            or (ref_count >= 3)
-        )
-        if looks_like_reference:
-            for idx in range(i, j):
-                remove[idx] = True
-            i = j
-            continue
-
-        i += 1
-
-    cleaned = "".join(token for idx, token in enumerate(tokens) if not remove[idx])
-    cleaned = REFERENCE_PARENS_RE.sub("", cleaned)
-    cleaned = MALFORMED_HEAD_REF_RE.sub("", cleaned)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
-    cleaned = re.sub(r"\s+([,.;:!?])", r"\1", cleaned)
-    cleaned = re.sub(r"([(\[{])\s+", r"\1", cleaned)
-    cleaned = re.sub(r"\s+([)\]}])", r"\1", cleaned)
-    cleaned = re.sub(r"\s*-\s*([,.;:!?])", r"\1", cleaned)
-    cleaned = cleaned.strip(" ;,")
-    return cleaned
+            j += 1
+
+        if not looks_like_reference(refs, books, conts, seps):
+            for span_kind, token in tokens[i:j]:
+                kept.append(token)
+                if span_kind == "ref":
+                    colons += token.count(":")
+                elif token == ":":
+                    colons += 1
+                elif token == "(":
+                    has_paren = True
+        i = j
+
+    cleaned = "".join(kept)
+    # Both patterns need a chapter:verse colon; the parenthesized one an "(" too.
+    if colons and has_paren:
+        cleaned = REFERENCE_PARENS_RE.sub("", cleaned)
+    if colons >= 2:
+        cleaned = MALFORMED_HEAD_REF_RE.sub("", cleaned)
+    return REFERENCE_PUNCTUATION(cleaned)
 
 
 def trim_low_confidence_tail(text: str, reference_text: str, max_ratio: float = 1.35) -> str:
@@ -764,14 +1145,103 @@ def load_rows(path: Path) -> List[Dict[str, str]]:
         return [dict(row) for row in csv.DictReader(handle)]
 
 
-def write_rows(path: Path, rows: List[Dict[str, str]]) -> None:
-    fields = ["book_name", "grouping", "order_index", "chapter", "verse", "text", "pericope"]
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fields)
+OUTPUT_FIELDS = ["book_name", "grouping", "order_index", "chapter", "verse", "text", "pericope"]
+
+
+def open_output(partial: Path, resume_at: Optional[int]) -> Tuple[TextIO, csv.DictWriter]:
+    """Open the streamed CSV, either fresh or cut back to the byte offset of a checkpoint."""
+    partial.parent.mkdir(parents=True, exist_ok=True)
+    if resume_at is None:
+        handle = partial.open("w", encoding="utf-8", newline="")
+        writer = csv.DictWriter(handle, fieldnames=OUTPUT_FIELDS)
         writer.writeheader()
-        for row in rows:
-            writer.writerow({field: row.get(field, "") for field in fields})
+        return handle, writer
+    with partial.open("r+b") as raw:
+        raw.truncate(resume_at)
+    handle = partial.open("a", encoding="utf-8", newline="")
+    return handle, csv.DictWriter(handle, fieldnames=OUTPUT_FIELDS)
+
+
+def checkpoint_path(out_csv: Path) -> Path:
+    return out_csv.with_name(out_csv.name + ".checkpoint.json")
+
+
+def write_checkpoint(
+    path: Path,
+    run_key: Dict[str, Any],
+    rows_done: int,
+    last_row: Dict[str, str],
+    csv_bytes: int,
+    stats: Stats,
+    examples: List[Dict[str, str]],
+    low_confidence_examples: List[Dict[str, str]],
+) -> None:
+    payload = {
+        "run": run_key,
+        "rows_done": rows_done,
+        "last_chapter": {
+            "book": (last_row.get("book_name") or "").strip(),
+            "chapter": (last_row.get("chapter") or "").strip(),
+        },
+        "csv_bytes": csv_bytes,
+        "stats": {counter.name: getattr(stats, counter.name) for counter in fields(stats)},
+        "examples": examples,
+        "low_confidence_examples": low_confidence_examples,
+    }
+    partial = path.with_name(path.name + ".partial")
+    partial.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(partial, path)
+
+
+def read_checkpoint(path: Path, run_key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("run") != run_key:
+        raise SystemExit(f"{path} was written for other inputs or settings; rerun without --resume.")
+    stats = Stats(**payload["stats"])
+    stats.phrase_fixes = Counter(stats.phrase_fixes)
+    payload["stats"] = stats
+    return payload
+
+
+def choose_pericope_reference(
+    pericope: str,
+    pericope_index: Dict[Tuple[str, str, int], RowRef],
+    book: str,
+    chapter: str,
+    verses: Sequence[int],
+    min_ratio: float,
+) -> Optional[RowRef]:
+    """
+    TB1 heading for a TB2 heading: of the headings standing before verses,
+    the one with the highest letter ratio, if it reaches min_ratio. Identical
+    letters short-circuit, and the length and letter-multiset bounds reject
+    unrelated headings before difflib runs.
+    """
+    norm = normalize_letters(pericope)
+    if not norm:
+        return None
+    counts: Optional[Counter[str]] = None
+    best: Optional[RowRef] = None
+    best_ratio = 0.0
+    for verse in verses:
+        heading = pericope_index.get((book, chapter, verse))
+        if heading is None:
+            continue
+        if heading.normalized == norm:
+            return heading
+        floor = max(min_ratio, best_ratio)
+        if length_ratio_bound(len(norm), len(heading.normalized)) < floor:
+            continue
+        if counts is None:
+            counts = Counter(norm)
+        if letter_ratio_bound(counts, heading.letter_counts, len(norm) + len(heading.normalized)) < floor:
+            continue
+        ratio = sequence_ratio(norm, heading.normalized)
+        if ratio >= floor and ratio > best_ratio:
+            best, best_ratio = heading, ratio
+    return best
 
 
 def index_tb1_rows(tb1_rows: List[Dict[str, str]]) -> Dict[Tuple[str, str], Dict[int, RowRef]]:
@@ -787,148 +1257,828 @@ def index_tb1_rows(tb1_rows: List[Dict[str, str]]) -> Dict[Tuple[str, str], Dict
             verse = int(verse_raw)
         except ValueError:
             continue
-        index[(book, chapter)][verse] = RowRef(verse=verse, text=text, normalized=normalize_letters(text))
+        stream = build_stream(text)
+        index[(book, chapter)][verse] = RowRef(
+            verse=verse,
+            text=text,
+            normalized=stream.letters,
+            stream=stream,
+            boundaries=stream.inner_boundaries(),
+            letter_counts=Counter(stream.letters),
+        )
     return index
 
 
-def main() -> None:
-    args = parse_args()
-
-    tb2_rows = load_rows(args.tb2_csv)
-    tb1_rows = load_rows(args.tb1_csv)
+def index_tb1_pericopes(tb1_rows: List[Dict[str, str]]) -> Dict[Tuple[str, str, int], RowRef]:
+    """TB1 headings keyed by the (book, chapter, verse) they stand before."""
+    index: Dict[Tuple[str, str, int], RowRef] = {}
+    for row in tb1_rows:
+        book = (row.get("book_name") or "").strip()
+        chapter = (row.get("chapter") or "").strip()
+        text = normalize_spacing(row.get("pericope") or "")
+        if not book or not chapter or not text:
+            continue
+        try:
+            verse = int((row.get("verse") or "").strip())
+        except ValueError:
+            continue
+        stream = build_stream(text)
+        index[(book, chapter, verse)] = RowRef(
+            verse=verse,
+            text=text,
+            normalized=stream.letters,
+            stream=stream,
+            boundaries=stream.inner_boundaries(),
+            letter_counts=Counter(stream.letters),
+        )
+    return index
 
-    tb1_index = index_tb1_rows(tb1_rows)
-    lexicon, hyphen_lookup = build_tb1_lexicon(tb1_rows)
 
-    output_rows: List[Dict[str, str]] = []
-    stats = Stats()
-    examples: List[Dict[str, str]] = []
-    low_confidence_examples: List[Dict[str, str]] = []
+def row_ref_fields(ref: RowRef) -> Tuple[Any, ...]:
+    """Plain tuple for the TB1 cache; cached_row_ref() turns it back into a RowRef."""
+    return (
+        ref.verse,
+        ref.text,
+        ref.normalized,
+        dict(ref.letter_counts),
+        ref.stream.word_starts,
+        ref.stream.word_ends,
+        ref.stream.boundaries,
+    )
 
-    for row in tb2_rows:
-        stats.rows_total += 1
-        out = dict(row)
 
-        source_text = normalize_spacing(row.get("text") or "")
-        source_pericope = normalize_spacing(row.get("pericope") or "")
+def cached_row_ref(
+    verse: int,
+    text: str,
+    normalized: str,
+    counts: Dict[str, int],
+    word_starts: List[int],
+    word_ends: List[int],
+    boundaries: List[int],
+) -> RowRef:
+    stream = TokenStream(text, normalized, word_starts, word_ends, boundaries)
+    return RowRef(
+        verse=verse,
+        text=text,
+        normalized=normalized,
+        stream=stream,
+        boundaries=stream.inner_boundaries(),
+        letter_counts=Counter(counts),
+    )
 
-        stats.short_runs_before += len(SHORT_RUN_RE.findall(source_text))
 
-        book = (row.get("book_name") or "").strip()
-        chapter = (row.get("chapter") or "").strip()
-        verse_raw = (row.get("verse") or "").strip()
-        chapter_index = tb1_index.get((book, chapter), {})
+def file_sha256(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
 
-        aligned_text = source_text
-        aligned_pericope = source_pericope
-        method = "fallback"
-        confidence = 0.0
 
-        verse_num: Optional[int] = None
-        try:
-            verse_num = int(verse_raw)
-        except ValueError:
-            verse_num = None
+def read_tb1_cache(path: Path, digest: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < TB1_CACHE_HEADER.size:
+        return None
+    magic, version, cached_digest = TB1_CACHE_HEADER.unpack_from(data, 0)
+    if magic != TB1_CACHE_MAGIC or version != TB1_CACHE_VERSION or cached_digest != digest:
+        return None
+    return pickle.loads(data[TB1_CACHE_HEADER.size :])
 
-        direct_ref: Optional[RowRef] = chapter_index.get(verse_num) if verse_num is not None else None
 
-        if verse_num is not None and chapter_index:
+def write_tb1_cache(path: Path, digest: bytes, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    with partial.open("wb") as handle:
+        handle.write(TB1_CACHE_HEADER.pack(TB1_CACHE_MAGIC, TB1_CACHE_VERSION, digest))
+        pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(partial, path)
+
+
+def load_tb1_reference(
+    tb1_csv: Path, cache_path: Optional[Path]
+) -> Tuple[
+    Dict[Tuple[str, str], Dict[int, RowRef]],
+    Dict[Tuple[str, str, int], RowRef],
+    Counter[str],
+    Dict[str, str],
+    Dict[str, Any],
+]:
+    """
+    TB1 verse index, pericope index, lexicon and hyphen lookup, from the cache when its hash matches
+    the CSV. The cache holds plain tuples rather than RowRef objects so it
+    loads the same whether this file runs as a script or is imported.
+    """
+    started = time.perf_counter()
+    report: Dict[str, Any] = {"path": str(cache_path) if cache_path else None, "status": "disabled"}
+    digest = file_sha256(tb1_csv) if cache_path is not None else b""
+    payload = read_tb1_cache(cache_path, digest) if cache_path is not None else None
+
+    if payload is not None:
+        tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]] = {
+            key: {cached[0]: cached_row_ref(*cached) for cached in refs} for key, refs in payload["index"].items()
+        }
+        pericope_index: Dict[Tuple[str, str, int], RowRef] = {
+            (book, chapter, cached[0]): cached_row_ref(*cached) for book, chapter, cached in payload["pericopes"]
+        }
+        lexicon: Counter[str] = Counter(payload["lexicon"])
+        hyphen_lookup: Dict[str, str] = payload["hyphen_lookup"]
+        report["status"] = "hit"
+    else:
+        tb1_rows = load_rows(tb1_csv)
+        tb1_index = index_tb1_rows(tb1_rows)
+        pericope_index = index_tb1_pericopes(tb1_rows)
+        lexicon, hyphen_lookup = build_tb1_lexicon(tb1_rows)
+        if cache_path is not None:
+            write_tb1_cache(
+                cache_path,
+                digest,
+                {
+                    "index": {key: [row_ref_fields(ref) for ref in refs.values()] for key, refs in tb1_index.items()},
+                    "pericopes": [
+                        (book, chapter, row_ref_fields(ref)) for (book, chapter, _), ref in pericope_index.items()
+                    ],
+                    "lexicon": dict(lexicon),
+                    "hyphen_lookup": hyphen_lookup,
+                },
+            )
+            report["status"] = "miss"
+
+    report["seconds"] = round(time.perf_counter() - started, 4)
+    return tb1_index, pericope_index, lexicon, hyphen_lookup, report
+
+
+def prepare_chapter_alignments(
+    tb2_rows: List[Dict[str, str]],
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    engine: str,
+    stats: Optional[Stats] = None,
+) -> Dict[int, Tuple[ChapterAlignment, int]]:
+    """
+    Align every TB2 chapter that has a TB1 chapter; keyed by TB2 row position.
+    Chapters over the edit budget are left out, so plan_row aligns their
+    verses one by one.
+    """
+    chapters: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for position, row in enumerate(tb2_rows):
+        key = ((row.get("book_name") or "").strip(), (row.get("chapter") or "").strip())
+        if key in tb1_index and (row.get("verse") or "").strip().isdigit():
+            chapters[key].append(position)
+
+    by_row: Dict[int, Tuple[ChapterAlignment, int]] = {}
+    for key, positions in chapters.items():
+        texts = [normalize_spacing(tb2_rows[position].get("text") or "") for position in positions]
+        aligned = align_chapter(texts, tb1_index[key], engine)
+        if aligned is None:
+            if stats is not None:
+                stats.chapters_over_edit_budget += 1
+            continue
+        alignment, offsets = aligned
+        for position, offset in zip(positions, offsets):
+            by_row[position] = (alignment, offset)
+    return by_row
+
+
+def plan_row(
+    row: Dict[str, str],
+    position: int,
+    settings: AlignSettings,
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    pericope_index: Dict[Tuple[str, str, int], RowRef],
+    chapter_alignments: Dict[int, Tuple[ChapterAlignment, int]],
+    stats: Optional[Stats] = None,
+    ratio_cache: Optional[Dict[int, float]] = None,
+) -> RowPlan:
+    source_text = normalize_spacing(row.get("text") or "")
+    source_pericope = normalize_spacing(row.get("pericope") or "")
+
+    book = (row.get("book_name") or "").strip()
+    chapter = (row.get("chapter") or "").strip()
+    verse_raw = (row.get("verse") or "").strip()
+    chapter_index = tb1_index.get((book, chapter), {})
+
+    verse_num: Optional[int] = None
+    try:
+        verse_num = int(verse_raw)
+    except ValueError:
+        verse_num = None
+
+    direct_ref: Optional[RowRef] = chapter_index.get(verse_num) if verse_num is not None else None
+    plan = RowPlan(source_text, source_pericope, "fallback", 0.0, None, direct_ref)
+
+    if position in chapter_alignments:
+        alignment, offset = chapter_alignments[position]
+        projected, ref, ratio = project_chapter_boundaries(source_text, alignment, offset)
+        plan.confidence = ratio
+        if ref is not None and ratio >= settings.min_direct_ratio:
+            plan.method, plan.ref, plan.chapter_text = "alignment_chapter", ref, projected
+    elif verse_num is not None and chapter_index:
+        tb2_norm = normalize_letters(source_text)
+        if (
+            settings.fast_path
+            and direct_ref is not None
+            and matches_reference_boundaries(source_text, tb2_norm, direct_ref)
+        ):
+            # choose_reference would take the direct verse at ratio 1.0.
+            plan.method, plan.confidence, plan.ref, plan.fast_path = "alignment_same", 1.0, direct_ref, True
+        else:
             ref, mode, ratio = choose_reference(
-                tb2_norm=normalize_letters(source_text),
+                tb2_norm=tb2_norm,
                 ref_rows=chapter_index,
                 verse=verse_num,
-                min_direct_ratio=args.min_direct_ratio,
-                min_neighbor_ratio=args.min_neighbor_ratio,
-                neighbor_window=args.neighbor_window,
+                min_direct_ratio=settings.min_direct_ratio,
+                min_neighbor_ratio=settings.min_neighbor_ratio,
+                neighbor_window=settings.neighbor_window,
+                stats=stats,
+                ratio_cache=ratio_cache,
             )
-            confidence = ratio
+            plan.confidence = ratio
             if ref is not None:
-                aligned_text = project_boundaries(source_text, ref.text)
-                if source_pericope:
-                    aligned_pericope = project_boundaries(source_pericope, ref.text)
-                method = "alignment_same" if mode == "same" else "alignment_neighbor"
-            else:
-                method = "fallback"
-
-        if method == "fallback":
-            stats.rows_fallback += 1
-            aligned_text = fallback_clean_text(source_text, lexicon)
-            if source_pericope:
-                aligned_pericope = fallback_clean_text(source_pericope, lexicon)
-            if confidence < args.min_neighbor_ratio:
-                if direct_ref is not None:
-                    aligned_text = trim_low_confidence_tail(aligned_text, direct_ref.text)
-                stats.low_confidence_rows += 1
-                if len(low_confidence_examples) < 30:
-                    low_confidence_examples.append(
-                        {
-                            "book": book,
-                            "chapter": chapter,
-                            "verse": verse_raw,
-                            "ratio": round(confidence, 4),
-                            "before": source_text[:220],
-                            "after": aligned_text[:220],
-                        }
-                    )
-        elif method == "alignment_same":
-            stats.rows_alignment_same_verse += 1
-        elif method == "alignment_neighbor":
-            stats.rows_alignment_neighbor += 1
-
-        # Final normalizations
-        aligned_text = apply_static_safe_phrase_fixes(aligned_text)
-        aligned_text = apply_suffix_join(aligned_text)
-        aligned_text = restore_hyphen_forms(aligned_text, hyphen_lookup)
-        aligned_text = remove_cross_reference_noise(aligned_text)
+                plan.method = "alignment_same" if mode == "same" else "alignment_neighbor"
+                plan.ref = ref
+
+    if source_pericope and verse_num is not None:
+        # Headings move with the verse numbering, so also try the heading
+        # before the TB1 verse chosen for the text.
+        verses = [verse_num]
+        if plan.ref is not None and plan.ref.verse != verse_num:
+            verses.append(plan.ref.verse)
+        plan.pericope_ref = choose_pericope_reference(
+            source_pericope, pericope_index, book, chapter, verses, settings.min_direct_ratio
+        )
+    return plan
+
+
+def is_low_confidence(plan: RowPlan, settings: AlignSettings) -> bool:
+    return plan.method == "fallback" and plan.confidence < settings.min_neighbor_ratio
+
+
+def finish_row(
+    plan: RowPlan,
+    settings: AlignSettings,
+    scorer: FallbackScorer,
+    hyphen_lookup: Dict[str, str],
+    phrase_fixes: Optional[Counter[str]] = None,
+) -> Tuple[str, str, str]:
+    """Cleaned text and pericope, plus the text as it stood after the fallback (for low-confidence examples)."""
+    source_text = plan.source_text
+    source_pericope = plan.source_pericope
+    aligned_text = source_text
+    aligned_pericope = source_pericope
+
+    if plan.method == "alignment_chapter" and plan.ref is not None and plan.chapter_text is not None:
+        aligned_text = plan.chapter_text
+    elif plan.ref is not None and not plan.fast_path:
+        aligned_text = project_onto_stream(source_text, plan.ref.stream, plan.ref.boundaries, settings.align_engine)
+
+    # Headings align against TB1 headings only; without a matching heading
+    # they get the conservative local merges instead of an alignment.
+    if source_pericope:
+        if plan.pericope_ref is not None:
+            aligned_pericope = project_onto_stream(
+                source_pericope, plan.pericope_ref.stream, plan.pericope_ref.boundaries, settings.align_engine
+            )
+        else:
+            aligned_pericope = fallback_clean_text(source_pericope, scorer)
+
+    if plan.method == "fallback":
+        aligned_text = fallback_clean_text(source_text, scorer)
+        if is_low_confidence(plan, settings) and plan.direct_ref is not None:
+            aligned_text = trim_low_confidence_tail(aligned_text, plan.direct_ref.text)
+    fallback_text = aligned_text
+
+    # Final normalizations
+    aligned_text = apply_static_safe_phrase_fixes(aligned_text, phrase_fixes)
+    aligned_text = apply_suffix_join(aligned_text)
+    aligned_text = restore_hyphen_forms(aligned_text, hyphen_lookup)
+    aligned_text = remove_cross_reference_noise(aligned_text)
+    aligned_text = normalize_punctuation_spacing(aligned_text)
+    if plan.direct_ref is not None:
+        aligned_text = trim_low_confidence_tail(aligned_text, plan.direct_ref.text, max_ratio=1.35)
         aligned_text = normalize_punctuation_spacing(aligned_text)
-        if direct_ref is not None:
-            aligned_text = trim_low_confidence_tail(aligned_text, direct_ref.text, max_ratio=1.35)
-            aligned_text = normalize_punctuation_spacing(aligned_text)
-
-        if aligned_pericope:
-            aligned_pericope = apply_static_safe_phrase_fixes(aligned_pericope)
-            aligned_pericope = apply_suffix_join(aligned_pericope)
-            aligned_pericope = restore_hyphen_forms(aligned_pericope, hyphen_lookup)
-            aligned_pericope = remove_cross_reference_noise(aligned_pericope)
-            aligned_pericope = normalize_punctuation_spacing(aligned_pericope)
 
-        out["text"] = aligned_text
-        out["pericope"] = aligned_pericope
-        output_rows.append(out)
-
-        stats.short_runs_after += len(SHORT_RUN_RE.findall(aligned_text))
-
-        if aligned_text != source_text or aligned_pericope != source_pericope:
-            stats.rows_changed += 1
-            if len(examples) < args.preview_limit:
-                examples.append(
+    if aligned_pericope:
+        aligned_pericope = apply_static_safe_phrase_fixes(aligned_pericope, phrase_fixes)
+        aligned_pericope = apply_suffix_join(aligned_pericope)
+        aligned_pericope = restore_hyphen_forms(aligned_pericope, hyphen_lookup)
+        aligned_pericope = remove_cross_reference_noise(aligned_pericope)
+        aligned_pericope = normalize_punctuation_spacing(aligned_pericope)
+
+    return aligned_text, aligned_pericope, fallback_text
+
+
+def tally_row(
+    stats: Stats,
+    examples: List[Dict[str, str]],
+    low_confidence_examples: List[Dict[str, str]],
+    preview_limit: int,
+    row: Dict[str, str],
+    plan: RowPlan,
+    settings: AlignSettings,
+    aligned_text: str,
+    aligned_pericope: str,
+    fallback_text: str,
+) -> None:
+    book = (row.get("book_name") or "").strip()
+    chapter = (row.get("chapter") or "").strip()
+    verse_raw = (row.get("verse") or "").strip()
+
+    stats.rows_total += 1
+    stats.short_runs_before += len(SHORT_RUN_RE.findall(plan.source_text))
+    if plan.method == "fallback":
+        stats.rows_fallback += 1
+        if is_low_confidence(plan, settings):
+            stats.low_confidence_rows += 1
+            if len(low_confidence_examples) < 30:
+                low_confidence_examples.append(
                     {
                         "book": book,
                         "chapter": chapter,
                         "verse": verse_raw,
-                        "method": method,
-                        "ratio": round(confidence, 4),
-                        "before": source_text[:240],
-                        "after": aligned_text[:240],
+                        "ratio": round(plan.confidence, 4),
+                        "before": plan.source_text[:220],
+                        "after": fallback_text[:220],
                     }
                 )
+    elif plan.method == "alignment_same":
+        stats.rows_alignment_same_verse += 1
+        stats.rows_fast_path += plan.fast_path
+    elif plan.method == "alignment_neighbor":
+        stats.rows_alignment_neighbor += 1
+    elif plan.method == "alignment_chapter":
+        stats.rows_alignment_chapter += 1
+
+    stats.short_runs_after += len(SHORT_RUN_RE.findall(aligned_text))
+
+    if aligned_text != plan.source_text or aligned_pericope != plan.source_pericope:
+        stats.rows_changed += 1
+        if len(examples) < preview_limit:
+            examples.append(
+                {
+                    "book": book,
+                    "chapter": chapter,
+                    "verse": verse_raw,
+                    "method": plan.method,
+                    "ratio": round(plan.confidence, 4),
+                    "before": plan.source_text[:240],
+                    "after": aligned_text[:240],
+                }
+            )
 
-    write_rows(args.out_csv, output_rows)
 
+def check_fast_path(
+    row: Dict[str, str],
+    position: int,
+    plan: RowPlan,
+    output: Tuple[str, str],
+    settings: AlignSettings,
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    pericope_index: Dict[Tuple[str, str, int], RowRef],
+    scorer: FallbackScorer,
+    hyphen_lookup: Dict[str, str],
+    stats: Stats,
+) -> None:
+    """--fast-path-check: redo a fast-path row through choose_reference and projection and compare."""
+    full_settings = replace(settings, fast_path=False)
+    full_plan = plan_row(row, position, full_settings, tb1_index, pericope_index, {})
+    full_text, full_pericope, _ = finish_row(full_plan, full_settings, scorer, hyphen_lookup)
+    same_plan = (full_plan.method, full_plan.confidence, full_plan.ref) == (plan.method, plan.confidence, plan.ref)
+    if same_plan and (full_text, full_pericope) == output:
+        return
+    stats.fast_path_mismatches += 1
+    if len(stats.fast_path_mismatch_examples) < 30:
+        stats.fast_path_mismatch_examples.append(
+            {
+                "book": (row.get("book_name") or "").strip(),
+                "chapter": (row.get("chapter") or "").strip(),
+                "verse": (row.get("verse") or "").strip(),
+                "full_method": full_plan.method,
+                "fast_path": output[0][:240],
+                "full_path": full_text[:240],
+            }
+        )
+
+
+# One cleaned row: (position, output row, slim plan, text after fallback).
+RowOutcome = Tuple[int, Dict[str, str], RowPlan, str]
+
+
+def clean_row_block(
+    rows: List[Tuple[int, Dict[str, str]]],
+    settings: AlignSettings,
+    alignment: str,
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    pericope_index: Dict[Tuple[str, str, int], RowRef],
+    scorer: FallbackScorer,
+    hyphen_lookup: Dict[str, str],
+    stats: Stats,
+) -> List[RowOutcome]:
+    block_rows = [row for _, row in rows]
+    chapter_alignments: Dict[int, Tuple[ChapterAlignment, int]] = {}
+    if alignment == "chapter":
+        chapter_alignments = prepare_chapter_alignments(block_rows, tb1_index, settings.align_engine, stats)
+
+    outcomes: List[RowOutcome] = []
+    for local, (position, row) in enumerate(rows):
+        plan = plan_row(row, local, settings, tb1_index, pericope_index, chapter_alignments, stats)
+        aligned_text, aligned_pericope, fallback_text = finish_row(
+            plan, settings, scorer, hyphen_lookup, stats.phrase_fixes
+        )
+        if plan.fast_path and settings.fast_path_check:
+            check_fast_path(
+                row,
+                local,
+                plan,
+                (aligned_text, aligned_pericope),
+                settings,
+                tb1_index,
+                pericope_index,
+                scorer,
+                hyphen_lookup,
+                stats,
+            )
+        if plan.source_pericope:
+            if plan.pericope_ref is not None:
+                stats.pericopes_heading_aligned += 1
+            else:
+                stats.pericopes_unmatched += 1
+        out = dict(row)
+        out["text"] = aligned_text
+        out["pericope"] = aligned_pericope
+        # tally_row only reads the method, ratio and sources; leave the TB1 refs behind.
+        slim = RowPlan(plan.source_text, plan.source_pericope, plan.method, plan.confidence, None, None)
+        slim.fast_path = plan.fast_path
+        outcomes.append((position, out, slim, fallback_text))
+    return outcomes
+
+
+def shard_rows(tb2_rows: List[Dict[str, str]]) -> List[List[Tuple[int, Dict[str, str]]]]:
+    shards: Dict[Tuple[str, str], List[Tuple[int, Dict[str, str]]]] = {}
+    for position, row in enumerate(tb2_rows):
+        key = ((row.get("book_name") or "").strip(), (row.get("chapter") or "").strip())
+        shards.setdefault(key, []).append((position, row))
+    return list(shards.values())
+
+
+# Per-process TB1 structures for --workers, loaded once by init_shard_worker()
+# from the TB1 cache instead of being pickled into every task.
+_shard_state: Dict[str, Any] = {}
+
+
+def init_shard_worker(tb1_csv: Path, cache_path: Optional[Path], settings: AlignSettings, alignment: str) -> None:
+    tb1_index, pericope_index, lexicon, hyphen_lookup, _ = load_tb1_reference(tb1_csv, cache_path)
+    _shard_state.update(
+        tb1_index=tb1_index,
+        pericope_index=pericope_index,
+        scorer=FallbackScorer(lexicon),
+        hyphen_lookup=hyphen_lookup,
+        settings=settings,
+        alignment=alignment,
+    )
+
+
+def clean_shard(rows: List[Tuple[int, Dict[str, str]]]) -> Tuple[List[RowOutcome], Stats]:
+    stats = Stats()
+    outcomes = clean_row_block(
+        rows,
+        _shard_state["settings"],
+        _shard_state["alignment"],
+        _shard_state["tb1_index"],
+        _shard_state["pericope_index"],
+        _shard_state["scorer"],
+        _shard_state["hyphen_lookup"],
+        stats,
+    )
+    return outcomes, stats
+
+
+def iter_shard_outcomes(
+    shards: List[List[Tuple[int, Dict[str, str]]]],
+    workers: int,
+    tb1_csv: Path,
+    cache_path: Optional[Path],
+    settings: AlignSettings,
+    alignment: str,
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    pericope_index: Dict[Tuple[str, str, int], RowRef],
+    scorer: FallbackScorer,
+    hyphen_lookup: Dict[str, str],
+) -> Iterator[Tuple[List[RowOutcome], Stats]]:
+    """
+    Outcomes and stats per shard, in shard order. Shards are whole chapters,
+    so chapter alignment and neighbor search see exactly what a single pass
+    over all rows would see, with or without --workers.
+    """
+    if workers <= 1:
+        for shard in shards:
+            stats = Stats()
+            outcomes = clean_row_block(
+                shard, settings, alignment, tb1_index, pericope_index, scorer, hyphen_lookup, stats
+            )
+            yield outcomes, stats
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_shard_worker,
+        initargs=(tb1_csv, cache_path, settings, alignment),
+    )
+    try:
+        yield from pool.map(clean_shard, shards, chunksize=4)
+    finally:
+        # On Ctrl-C do not wait for the shards still queued.
+        pool.shutdown(cancel_futures=True)
+
+
+@dataclass
+class SweepRow:
+    # The threshold-independent part of plan_row() for one TB2 row, computed
+    # once per --sweep; decide_sweep_row() applies one grid point to it.
+    plan: RowPlan
+    verse: int
+    # False when plan is already final: no TB1 chapter or verse number, or
+    # the fast path took the direct verse.
+    searchable: bool
+    direct_ratio: float = 0.0
+    # (verse, ratio, reference) of the neighbors within the widest window that
+    # could beat direct_ratio, in the order choose_reference() visits them.
+    neighbors: List[Tuple[int, float, RowRef]] = field(default_factory=list)
+
+
+def prepare_sweep_row(
+    row: Dict[str, str],
+    settings: AlignSettings,
+    max_window: int,
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+) -> SweepRow:
+    # Pericopes are left out: nothing the sweep counts depends on them.
+    source_text = normalize_spacing(row.get("text") or "")
+    book = (row.get("book_name") or "").strip()
+    chapter_index = tb1_index.get((book, (row.get("chapter") or "").strip()), {})
+    try:
+        verse = int((row.get("verse") or "").strip())
+    except ValueError:
+        return SweepRow(RowPlan(source_text, "", "fallback", 0.0, None, None), 0, False)
+
+    direct_ref = chapter_index.get(verse)
+    plan = RowPlan(source_text, "", "fallback", 0.0, None, direct_ref)
+    if not chapter_index:
+        return SweepRow(plan, verse, False)
+    tb2_norm = normalize_letters(source_text)
+    if (
+        settings.fast_path
+        and direct_ref is not None
+        and matches_reference_boundaries(source_text, tb2_norm, direct_ref)
+    ):
+        plan = replace(plan, method="alignment_same", confidence=1.0, ref=direct_ref, fast_path=True)
+        return SweepRow(plan, verse, False)
+
+    direct_ratio = sequence_ratio(tb2_norm, direct_ref.normalized) if direct_ref is not None else 0.0
+    # A neighbor only wins with a ratio above direct_ratio at every grid
+    # point, so the same bounds as choose_reference() can skip it here.
+    tb2_counts = Counter(tb2_norm)
+    neighbors: List[Tuple[int, float, RowRef]] = []
+    for candidate_verse in range(max(1, verse - max_window), verse + max_window + 1):
+        candidate = chapter_index.get(candidate_verse)
+        if candidate_verse == verse or candidate is None:
+            continue
+        if length_ratio_bound(len(tb2_norm), len(candidate.normalized)) <= direct_ratio:
+            continue
+        total = len(tb2_norm) + len(candidate.normalized)
+        if letter_ratio_bound(tb2_counts, candidate.letter_counts, total) <= direct_ratio:
+            continue
+        neighbors.append((candidate_verse, sequence_ratio(tb2_norm, candidate.normalized), candidate))
+    return SweepRow(plan, verse, True, direct_ratio, neighbors)
+
+
+def decide_sweep_row(row: SweepRow, settings: AlignSettings) -> RowPlan:
+    """plan_row() for one grid point, from a prepared SweepRow; mirrors choose_reference()."""
+    if not row.searchable:
+        return row.plan
+    direct_ref = row.plan.direct_ref
+    if direct_ref is not None and row.direct_ratio >= settings.min_direct_ratio:
+        return replace(row.plan, method="alignment_same", confidence=row.direct_ratio, ref=direct_ref)
+    best_ratio = row.direct_ratio
+    best_ref: Optional[RowRef] = None
+    for verse, ratio, candidate in row.neighbors:
+        if abs(verse - row.verse) <= settings.neighbor_window and ratio > best_ratio:
+            best_ratio, best_ref = ratio, candidate
+    if best_ref is not None and best_ratio >= settings.min_neighbor_ratio:
+        return replace(row.plan, method="alignment_neighbor", confidence=best_ratio, ref=best_ref)
+    return replace(row.plan, confidence=best_ratio)
+
+
+def sweep_thresholds(
+    tb2_rows: List[Dict[str, str]],
+    base: AlignSettings,
+    directs: Sequence[float],
+    neighbors: Sequence[float],
+    windows: Sequence[int],
+    tb1_index: Dict[Tuple[str, str], Dict[int, RowRef]],
+    scorer: FallbackScorer,
+    hyphen_lookup: Dict[str, str],
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate a threshold grid. Each row's ratios are computed once
+    (prepare_sweep_row); a grid point only re-decides method and reference,
+    and a row is rewritten once per distinct (method, reference,
+    low-confidence) outcome rather than once per setting.
+    """
+    prepared = [prepare_sweep_row(row, base, max(windows), tb1_index) for row in tb2_rows]
+    finished: Dict[Tuple[int, str, Optional[int], bool], str] = {}
+    results: List[Dict[str, Any]] = []
+
+    for direct, neighbor, window in itertools.product(directs, neighbors, windows):
+        settings = AlignSettings(direct, neighbor, window, base.align_engine, base.fast_path)
+        counts = Counter()
+        for position, sweep_row in enumerate(prepared):
+            plan = decide_sweep_row(sweep_row, settings)
+            low_confidence = is_low_confidence(plan, settings)
+            key = (position, plan.method, plan.ref.verse if plan.ref is not None else None, low_confidence)
+            text = finished.get(key)
+            if text is None:
+                text = finished[key] = finish_row(plan, settings, scorer, hyphen_lookup)[0]
+            counts[plan.method] += 1
+            counts["low_confidence"] += low_confidence
+            counts["short_runs_after"] += len(SHORT_RUN_RE.findall(text))
+        results.append(
+            {
+                "min_direct_ratio": direct,
+                "min_neighbor_ratio": neighbor,
+                "neighbor_window": window,
+                "alignment_same": counts["alignment_same"],
+                "alignment_neighbor": counts["alignment_neighbor"],
+                "fallback": counts["fallback"],
+                "low_confidence": counts["low_confidence"],
+                "short_runs_after": counts["short_runs_after"],
+            }
+        )
+        print(json.dumps(results[-1], ensure_ascii=False))
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    settings = AlignSettings(
+        args.min_direct_ratio,
+        args.min_neighbor_ratio,
+        args.neighbor_window,
+        args.align_engine,
+        fast_path=not args.no_fast_path,
+        fast_path_check=args.fast_path_check and not args.no_fast_path,
+    )
+
+    tb2_rows = load_rows(args.tb2_csv)
+
+    tb1_index, pericope_index, lexicon, hyphen_lookup, tb1_cache_report = load_tb1_reference(
+        args.tb1_csv, None if args.no_tb1_cache else args.tb1_cache
+    )
+    scorer = FallbackScorer(lexicon)
+
+    if args.sweep:
+        if args.alignment == "chapter":
+            raise SystemExit("--sweep evaluates verse-mode thresholds; drop --alignment chapter")
+        sweep = sweep_thresholds(
+            tb2_rows,
+            settings,
+            args.sweep_direct or [args.min_direct_ratio],
+            args.sweep_neighbor or [args.min_neighbor_ratio],
+            args.sweep_window or [args.neighbor_window],
+            tb1_index,
+            scorer,
+            hyphen_lookup,
+        )
+        args.sweep_json.parent.mkdir(parents=True, exist_ok=True)
+        args.sweep_json.write_text(
+            json.dumps({"input_tb2_csv": str(args.tb2_csv), "input_tb1_csv": str(args.tb1_csv), "sweep": sweep}, ensure_ascii=False, indent=2)
+            + "\n",
+            encoding="utf-8",
+        )
+        return
+
+    settings_summary = {
+        "min_direct_ratio": args.min_direct_ratio,
+        "min_neighbor_ratio": args.min_neighbor_ratio,
+        "neighbor_window": args.neighbor_window,
+        "align_engine": args.align_engine,
+        "alignment": args.alignment,
+        "fast_path": settings.fast_path,
+    }
+    # A checkpoint only resumes the run it was written for.
+    run_key = {
+        "tb2_sha256": file_sha256(args.tb2_csv).hex(),
+        "tb1_sha256": file_sha256(args.tb1_csv).hex(),
+        "settings": settings_summary,
+        "fast_path_check": settings.fast_path_check,
+        "preview_limit": args.preview_limit,
+    }
+    checkpoint_file = checkpoint_path(args.out_csv)
+    partial_csv = args.out_csv.with_name(args.out_csv.name + ".partial")
+    checkpoint = read_checkpoint(checkpoint_file, run_key) if args.resume else None
+    if args.resume and (checkpoint is None or not partial_csv.exists()):
+        print(f"No checkpoint to resume at {checkpoint_file}; starting from the first row.", file=sys.stderr)
+        checkpoint = None
+
+    stats = Stats()
+    examples: List[Dict[str, str]] = []
+    low_confidence_examples: List[Dict[str, str]] = []
+    rows_done = 0
+    if checkpoint is not None:
+        stats = checkpoint["stats"]
+        examples = checkpoint["examples"]
+        low_confidence_examples = checkpoint["low_confidence_examples"]
+        rows_done = checkpoint["rows_done"]
+        last = checkpoint["last_chapter"]
+        print(f"Resuming after {last['book']} {last['chapter']} ({rows_done} rows done).", file=sys.stderr)
+
+    # Shards before the checkpoint were fully written and tallied; the rest start over.
+    shards = [shard for shard in shard_rows(tb2_rows) if shard[0][0] >= rows_done]
+    handle, writer = open_output(partial_csv, checkpoint["csv_bytes"] if checkpoint is not None else None)
+    pending: Dict[int, Tuple[Dict[str, str], RowPlan, str]] = {}
+    shards_since_checkpoint = 0
+    # True while the CSV, stats and examples all cover exactly rows_done rows;
+    # only then may a checkpoint be written, Ctrl-C included.
+    consistent = True
+
+    def save_checkpoint() -> None:
+        handle.flush()
+        write_checkpoint(
+            checkpoint_file,
+            run_key,
+            rows_done,
+            tb2_rows[rows_done - 1],
+            handle.tell(),
+            stats,
+            examples,
+            low_confidence_examples,
+        )
+
+    try:
+        for shard_outcomes, shard_stats in iter_shard_outcomes(
+            shards,
+            args.workers,
+            args.tb1_csv,
+            None if args.no_tb1_cache else args.tb1_cache,
+            settings,
+            args.alignment,
+            tb1_index,
+            pericope_index,
+            scorer,
+            hyphen_lookup,
+        ):
+            consistent = False
+            for position, out, plan, fallback_text in shard_outcomes:
+                pending[position] = (out, plan, fallback_text)
+            # Rows are written and tallied in input order, so the CSV, stats
+            # and examples do not depend on sharding or on where a run resumed.
+            while rows_done in pending:
+                out, plan, fallback_text = pending.pop(rows_done)
+                writer.writerow({name: out.get(name, "") for name in OUTPUT_FIELDS})
+                tally_row(
+                    stats,
+                    examples,
+                    low_confidence_examples,
+                    args.preview_limit,
+                    tb2_rows[rows_done],
+                    plan,
+                    settings,
+                    out["text"],
+                    out["pericope"],
+                    fallback_text,
+                )
+                rows_done += 1
+            stats.merge(shard_stats)
+            consistent = not pending
+            shards_since_checkpoint += 1
+            if consistent and shards_since_checkpoint >= args.checkpoint_every > 0:
+                save_checkpoint()
+                shards_since_checkpoint = 0
+    except KeyboardInterrupt:
+        if consistent and rows_done:
+            save_checkpoint()
+        handle.close()
+        if checkpoint_file.exists():
+            raise SystemExit(f"Interrupted after {rows_done} rows; rerun with --resume to continue.")
+        raise SystemExit("Interrupted before the first checkpoint.")
+
+    handle.close()
+    os.replace(partial_csv, args.out_csv)
+    checkpoint_file.unlink(missing_ok=True)
     summary = {
         "input_tb2_csv": str(args.tb2_csv),
         "input_tb1_csv": str(args.tb1_csv),
         "output_csv": str(args.out_csv),
-        "settings": {
-            "min_direct_ratio": args.min_direct_ratio,
-            "min_neighbor_ratio": args.min_neighbor_ratio,
-            "neighbor_window": args.neighbor_window,
-        },
+        "settings": settings_summary,
         "rows": {
             "total": stats.rows_total,
             "changed": stats.rows_changed,
             "alignment_same_verse": stats.rows_alignment_same_verse,
+            "fast_path": stats.rows_fast_path,
             "alignment_neighbor": stats.rows_alignment_neighbor,
+            "alignment_chapter": stats.rows_alignment_chapter,
+            "chapters_over_edit_budget": stats.chapters_over_edit_budget,
             "fallback": stats.rows_fallback,
             "low_confidence_rows": stats.low_confidence_rows,
         },
@@ -936,9 +2086,32 @@ def main() -> None:
             "short_runs_before": stats.short_runs_before,
             "short_runs_after": stats.short_runs_after,
         },
+        "tb1_cache": tb1_cache_report,
+        "pericopes": {
+            "tb1_headings": len(pericope_index),
+            "aligned_to_tb1_heading": stats.pericopes_heading_aligned,
+            "no_matching_heading": stats.pericopes_unmatched,
+        },
+        "neighbor_search": {
+            "candidates": stats.neighbor_candidates,
+            "pruned_by_length": stats.neighbor_pruned_length,
+            "pruned_by_letters": stats.neighbor_pruned_letters,
+            "full_ratio": stats.neighbor_candidates - stats.neighbor_pruned_length - stats.neighbor_pruned_letters,
+        },
+        "phrase_fixes": {
+            "rules": len(STATIC_SAFE_PHRASE_FIXES),
+            "replacements": sum(stats.phrase_fixes.values()),
+            "fired": dict(stats.phrase_fixes.most_common()),
+        },
         "examples": examples,
         "low_confidence_examples": low_confidence_examples,
     }
+    if settings.fast_path_check:
+        summary["fast_path_check"] = {
+            "rows_checked": stats.rows_fast_path,
+            "mismatches": stats.fast_path_mismatches,
+            "examples": stats.fast_path_mismatch_examples[:30],
+        }
 
     args.summary_json.parent.mkdir(parents=True, exist_ok=True)
     args.summary_json.write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Tuple
 
 import fitz
 
+from text_spacing import COLLAPSE_WHITESPACE, PDF_SPAN_TRANSLATION, PDF_TOKEN_PUNCTUATION
+
 HEADER_TOP_MAX = 40.0
 BODY_TOP_MIN = 24.0
 BODY_BOTTOM_MAX = 512.0
@@ -135,11 +137,7 @@ def detect_book(header_text: str) -> Optional[str]:
 
 
 def clean_token(text: str) -> str:
-    text = text.replace("\u00a0", " ").replace(" ", " ")
-    text = text.replace("”", '"').replace("“", '"').replace("’", "'").replace("‘", "'")
-    text = text.replace("—", "-").replace("–", "-")
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return COLLAPSE_WHITESPACE(text.translate(PDF_SPAN_TRANSLATION))
 
 
 def is_bold(span: Span) -> bool:
@@ -191,12 +189,7 @@ def tokens_to_text(tokens: List[str]) -> str:
 
         out.append(token)
 
-    text = " ".join(out)
-    text = re.sub(r"\s+([,.;:!?])", r"\1", text)
-    text = re.sub(r"\(\s+", "(", text)
-    text = re.sub(r"\s+\)", ")", text)
-    text = re.sub(r"\s{2,}", " ", text).strip()
-    return text
+    return PDF_TOKEN_PUNCTUATION(" ".join(out))
 
 
 def ensure_entry(store: dict, book: str, chapter: int, verse: int) -> dict:
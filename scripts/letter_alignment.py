@@ -0,0 +1,230 @@
+"""
+Letter-stream alignment for projecting TB1 word boundaries onto TB2 text.
+
+The TB2 cleaner aligns two lowercase letter streams that are usually near
+identical: the same verse in two editions, differing only where wording
+changed. difflib.SequenceMatcher handles them in roughly quadratic time:
+each longest-match search walks every occurrence in b of every letter of a.
+The "anchors" engine makes the same longest-match-first choices, so it
+returns exactly difflib's blocks, but finds each longest match from letter
+runs (anchors) the two streams share, looked up in a dictionary, so long
+verses with scattered edits or trailing cross-reference noise cost about
+their length rather than its square. Ranges that share no anchor-sized run
+are searched by difflib itself.
+
+Both engines return the same shape: for each position of the first stream,
+the aligned position in the second stream, or None. difflib stays the
+default engine.
+
+diff_blocks() is a greedy O(ND) diff (Myers 1986) whose cost grows with the
+number D of differing letters. It is not an engine of its own: a shortest
+edit script breaks ties between equally short alignments differently from
+difflib's longest-match-first blocks, which moves projected word boundaries.
+It only serves as an edit-budget gate, telling close streams from divergent
+ones before difflib aligns them.
+"""
+
+from __future__ import annotations
+
+import difflib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+ENGINES = ("difflib", "anchors")
+
+# Letters per anchor. Longer anchors mean fewer chance hits on common
+# syllables, but more ranges whose longest match is too short to hold one.
+ANCHOR_SIZE = 12
+
+# diff_blocks() budgets this many edits per letter of len(a) + len(b) by
+# default: its cost grows with D squared, and streams that far apart are
+# better served by difflib. Near-identical verses stay far below it.
+MAX_EDIT_FRACTION = 0.2
+
+# Matching blocks as (a_start, b_start, size), like difflib's Match tuples.
+Blocks = List[Tuple[int, int, int]]
+
+
+def match_length(a: str, i: int, b: str, j: int, limit: Optional[int] = None) -> int:
+    """Length of the common run a[i:] / b[j:] (at most limit), found by galloping slice compares."""
+    if limit is None:
+        limit = min(len(a) - i, len(b) - j)
+    if limit <= 0 or a[i] != b[j]:
+        return 0
+    low, step = 1, 8
+    while low < limit:
+        high = min(limit, low + step)
+        if a[i + low : i + high] != b[j + low : j + high]:
+            break
+        low = high
+        step *= 2
+    else:
+        return limit
+    # a[i:i+low] matches and a[i:i+high] does not; bisect the gap.
+    while high - low > 1:
+        mid = (low + high) // 2
+        if a[i + low : i + mid] == b[j + low : j + mid]:
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+def diff_blocks(a: str, b: str, max_edits: Optional[int] = None) -> Optional[Blocks]:
+    """
+    Matching blocks of a shortest edit script between a and b, in order.
+    Returns None when more than max_edits insertions/deletions are needed.
+    """
+    n, m = len(a), len(b)
+    limit = n + m if max_edits is None else min(max_edits, n + m)
+    offset = limit + 1
+    # Furthest x reached on diagonal k, at index k + offset.
+    frontier = [0] * (2 * limit + 3)
+    # Step d only moves diagonals -d, -d+2, ..., d, so that is all the trace
+    # keeps per step: D*D/2 machine ints in total, not a frontier copy each step.
+    trace: List["array[int]"] = []
+
+    for d in range(limit + 1):
+        for k in range(-d, d + 1, 2):
+            i = k + offset
+            if k == -d or (k != d and frontier[i - 1] < frontier[i + 1]):
+                x = frontier[i + 1]
+            else:
+                x = frontier[i - 1] + 1
+            y = x - k
+            if x < n and y < m:
+                x += match_length(a, x, b, y)
+            frontier[i] = x
+            if x >= n and x - k >= m:
+                return _backtrack(trace, n, m)
+        trace.append(array("q", frontier[offset - d : offset + d + 1 : 2]))
+    return None
+
+
+def _backtrack(trace: List["array[int]"], n: int, m: int) -> Blocks:
+    """Walk back from (n, m); trace[d] holds diagonals -d..d (step 2) after step d."""
+    blocks: Blocks = []
+    x, y = n, m
+    for d in range(len(trace), 0, -1):
+        previous = trace[d - 1]
+        k = x - y
+        # Diagonal j of step d - 1 sits at previous[(j + d - 1) // 2].
+        if k == -d or (k != d and previous[(k + d - 2) // 2] < previous[(k + d) // 2]):
+            prev_k = k + 1
+            prev_x = previous[(k + d) // 2]
+            # An insertion: the diagonal run starts right at prev_x.
+            start_x = prev_x
+        else:
+            prev_k = k - 1
+            prev_x = previous[(k + d - 2) // 2]
+            # A deletion: the run starts one letter of a after prev_x.
+            start_x = prev_x + 1
+        size = x - start_x
+        if size > 0:
+            blocks.append((start_x, y - size, size))
+        x, y = prev_x, prev_x - prev_k
+    if x > 0:
+        # The opening diagonal run from (0, 0).
+        blocks.append((0, 0, x))
+    blocks.reverse()
+    return blocks
+
+
+def anchor_blocks(a: str, b: str, size: int = ANCHOR_SIZE) -> Blocks:
+    """
+    difflib's matching blocks for a and b, found the way SequenceMatcher
+    finds them (longest match first, earliest in a and then in b on ties,
+    then the same on either side of it), with each longest match looked up
+    from shared size-letter runs instead of a letter-by-letter scan.
+    """
+    if a == b:
+        return [(0, 0, len(a))] if a else []
+
+    runs_b: Dict[str, List[int]] = {}
+    for j in range(len(b) - size + 1):
+        runs_b.setdefault(b[j : j + size], []).append(j)
+    matcher: Optional[difflib.SequenceMatcher] = None
+
+    found: Blocks = []
+    queue = [(0, len(a), 0, len(b))]
+    while queue:
+        a_lo, a_hi, b_lo, b_hi = queue.pop()
+        best_i, best_j, best_size = longest_anchored_match(a, b, runs_b, size, a_lo, a_hi, b_lo, b_hi)
+        if not best_size:
+            # No anchor fits: the longest match, if any, is shorter than size.
+            if matcher is None:
+                matcher = difflib.SequenceMatcher(a=a, b=b, autojunk=False)
+            best_i, best_j, best_size = matcher.find_longest_match(a_lo, a_hi, b_lo, b_hi)
+            if not best_size:
+                continue
+        found.append((best_i, best_j, best_size))
+        if a_lo < best_i and b_lo < best_j:
+            queue.append((a_lo, best_i, b_lo, best_j))
+        if best_i + best_size < a_hi and best_j + best_size < b_hi:
+            queue.append((best_i + best_size, a_hi, best_j + best_size, b_hi))
+
+    # Join adjacent blocks, as get_matching_blocks() does.
+    blocks: Blocks = []
+    for a_start, b_start, block_size in sorted(found):
+        if blocks and blocks[-1][0] + blocks[-1][2] == a_start and blocks[-1][1] + blocks[-1][2] == b_start:
+            blocks[-1] = (blocks[-1][0], blocks[-1][1], blocks[-1][2] + block_size)
+        else:
+            blocks.append((a_start, b_start, block_size))
+    return blocks
+
+
+def longest_anchored_match(
+    a: str, b: str, runs_b: Dict[str, List[int]], size: int, a_lo: int, a_hi: int, b_lo: int, b_hi: int
+) -> Tuple[int, int, int]:
+    """
+    SequenceMatcher.find_longest_match() over a[a_lo:a_hi] / b[b_lo:b_hi]
+    when the longest match has at least size letters; (a_lo, b_lo, 0)
+    otherwise.
+    """
+    best_i, best_j, best_size = a_lo, b_lo, 0
+    # End in a of the last match grown on each diagonal i - j.
+    covered: Dict[int, int] = {}
+    for i in range(a_lo, a_hi - size + 1):
+        positions = runs_b.get(a[i : i + size])
+        if not positions:
+            continue
+        for j in positions[bisect_left(positions, b_lo) : bisect_right(positions, b_hi - size)]:
+            # Scanning i upwards meets every match at its first letter, so an
+            # anchor inside one already grown adds nothing.
+            if covered.get(i - j, a_lo) > i:
+                continue
+            run = match_length(a, i, b, j, min(a_hi - i, b_hi - j))
+            covered[i - j] = i + run
+            # Strictly longer only: ties keep the earliest i, then j, as difflib does.
+            if run > best_size:
+                best_i, best_j, best_size = i, j, run
+    return best_i, best_j, best_size
+
+
+def difflib_blocks(a: str, b: str) -> Blocks:
+    matcher = difflib.SequenceMatcher(a=a, b=b, autojunk=False)
+    return [(block.a, block.b, block.size) for block in matcher.get_matching_blocks() if block.size]
+
+
+def edit_budget(a: str, b: str, fraction: float = MAX_EDIT_FRACTION) -> int:
+    return int((len(a) + len(b)) * fraction)
+
+
+def letter_blocks(a: str, b: str, engine: str) -> Blocks:
+    """Matching blocks from engine, with difflib's longest-match-first ties."""
+    if engine == "anchors":
+        return anchor_blocks(a, b)
+    return difflib_blocks(a, b)
+
+
+def blocks_mapping(blocks: Blocks, length: int) -> List[Optional[int]]:
+    mapping: List[Optional[int]] = [None] * length
+    for a_start, b_start, size in blocks:
+        mapping[a_start : a_start + size] = range(b_start, b_start + size)
+    return mapping
+
+
+def align_letters(a: str, b: str, engine: str = "difflib") -> List[Optional[int]]:
+    """Map each position of a to its aligned position in b (None if unmatched)."""
+    return blocks_mapping(letter_blocks(a, b, engine), len(a))
@@ -16,9 +16,13 @@ import json
 import re
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from wordfreq import zipf_frequency
+from text_spacing import COLLAPSE_WHITESPACE
+from word_freq_table import ZipfLookup, load_zipf_frequency
+
+# Resolved in main() from --freq-table or wordfreq.
+zipf_frequency: Optional[ZipfLookup] = None
 
 
 WORD_RE = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ]+")
@@ -348,6 +352,12 @@ def parse_args() -> argparse.Namespace:
   parser.add_argument("input_csv", type=Path, help="CSV to refine (usually *_clean.csv).")
   parser.add_argument("output_csv", type=Path, help="Refined output CSV path.")
   parser.add_argument("--summary-json", type=Path, default=None, help="Optional summary JSON output path.")
+  parser.add_argument(
+    "--freq-table",
+    type=Path,
+    default=None,
+    help="Optional zipf table from word_freq_table.py; used instead of importing wordfreq.",
+  )
   return parser.parse_args()
 
 
@@ -457,12 +467,15 @@ def post_fix_text(text: str) -> Tuple[str, int]:
       fixed = pattern.sub(target, fixed)
       local_changes += 1
 
-  fixed = re.sub(r"\s+", " ", fixed).strip()
-  return fixed, local_changes
+  return COLLAPSE_WHITESPACE(fixed), local_changes
 
 
 def main() -> None:
+  global zipf_frequency
   args = parse_args()
+  zipf_frequency, freq_source = load_zipf_frequency(args.freq_table)
+  if zipf_frequency is None:
+    raise SystemExit("wordfreq is not installed; pass --freq-table built by word_freq_table.py.")
 
   source_rows = read_rows(args.source_csv)
   input_rows = read_rows(args.input_csv)
@@ -503,6 +516,7 @@ def main() -> None:
 
   text_all = "\n".join((row.get("text") or "") for row in output_rows)
   summary = {
+    "freq_source": freq_source,
     "rows_total": len(output_rows),
     "rows_changed": changed_rows,
     "replacement_patterns": len(replacements),
@@ -0,0 +1,11 @@
+"""
+The import scripts are run as standalone files from scripts/ and import their
+siblings directly, so the tests put scripts/ on sys.path the same way:
+
+  python3 -m pytest scripts/tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
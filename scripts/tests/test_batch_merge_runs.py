@@ -0,0 +1,64 @@
+import random
+import zlib
+from typing import Iterator, List, Tuple
+
+import pytest
+
+import clean_bible_import_text as cleaner
+
+pytest.importorskip("numpy")
+
+SYLLABLES = [
+    "ke", "tu", "run", "an", "ber", "kata", "lah", "me", "nga", "ta", "kan", "nya", "di", "se", "i", "Tu", "han",
+]  # fmt: skip
+# Joined forms the fake frequency source knows, so merges of 2-4 tokens happen.
+KNOWN = {"keturunan": 5.4, "berkatalah": 5.0, "mengatakan": 5.6, "tuhan": 6.2, "dikatakan": 4.9, "berkata": 5.8}
+
+
+def fake_zipf(word: str, lang: str) -> float:
+    """Deterministic, tie-heavy frequencies: known words score high, the rest one of four levels."""
+    if word in KNOWN:
+        return KNOWN[word] if lang == "id" else 0.0
+    return (0.0, 1.0, 2.5, 3.5)[zlib.crc32(f"{lang}:{word}".encode()) % 4]
+
+
+def reset_caches() -> None:
+    cleaner._lowered_token_freq.cache_clear()
+    cleaner._lowered_merged_word_freq.cache_clear()
+
+
+@pytest.fixture(params=["builtin", "fake"])
+def freq_source(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    # builtin: BIBLICAL_WORDS only, so almost every score ties.
+    monkeypatch.setattr(cleaner, "zipf_frequency", None if request.param == "builtin" else fake_zipf)
+    reset_caches()
+    yield request.param
+    reset_caches()
+
+
+def random_runs(seed: int, count: int) -> List[Tuple[str, ...]]:
+    rng = random.Random(seed)
+    vocabulary = SYLLABLES + sorted(cleaner.PREFIX_TOKENS) + sorted(cleaner.SUFFIX_TOKENS)
+    vocabulary += ["To", "bit", "yeru", "salem"]
+    return [tuple(rng.choice(vocabulary) for _ in range(rng.randint(1, 32))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("max_group", [1, 2, 3, 4, 5, 6])
+def test_batch_merge_runs_matches_merge_run(freq_source: str, max_group: int) -> None:
+    runs = random_runs(max_group, 400)
+    # Every length from 1 to 32 appears, in buckets of several runs.
+    runs += [
+        tuple(SYLLABLES[(start + i) % len(SYLLABLES)] for i in range(n)) for n in range(1, 33) for start in range(3)
+    ]
+
+    batched = cleaner.batch_merge_runs(runs, max_group)
+
+    assert batched == [cleaner.merge_run(list(run), max_group) for run in runs]
+    if max_group > 1:
+        assert any(merges for _, merges in batched)
+
+
+def test_batch_merge_runs_handles_repeats_and_empty_runs(freq_source: str) -> None:
+    runs: List[Tuple[str, ...]] = [(), ("Tu", "han"), ("Tu", "han"), ("ke", "tu", "run", "an"), ("di",)]
+
+    assert cleaner.batch_merge_runs(runs) == [cleaner.merge_run(list(run)) for run in runs]
@@ -0,0 +1,69 @@
+from typing import Dict, List
+
+import clean_tb2_syllable_spacing as tb2
+
+TB1_VERSES = [
+    "Maka berkatalah Tobit kepada anaknya, katanya: Dengarkanlah perkataanku ini.",
+    "Apabila aku mati, kuburkanlah aku dengan layak dan hormatilah ibumu seumur hidupmu.",
+    "Lakukanlah apa yang berkenan kepadanya dan jangan menyedihkan hatinya.",
+    "Ingatlah akan Tuhan setiap hari dan jangan berbuat dosa atau melanggar perintah-Nya.",
+]
+
+# The same chapter in TB2: syllable-split, and numbered one verse later.
+TB2_SHIFTED = [
+    "Pendahuluan pasal ini.",
+    "Maka ber kata lah To bit kepada anak nya, kata nya: Dengar kan lah per kata an ku ini.",
+    "Apa bila aku mati, kubur kan lah aku dengan la yak dan hormati lah ibu mu seumur hidup mu.",
+    "Laku kan lah apa yang ber kenan kepada nya dan jangan menye dih kan hati nya.",
+    "Ingat lah akan Tuhan setiap hari dan jangan ber buat dosa atau melanggar perintah-Nya.",
+]
+
+# Wording from elsewhere entirely: nothing a chapter-wide alignment can use.
+TB2_DIVERGENT = [
+    "Pada waktu itu datanglah seorang nabi dari utara membawa kabar tentang perang.",
+    "Seluruh kota gempar mendengar berita itu, dan para tua-tua berkumpul di gerbang.",
+    "Mereka mengutus orang ke gunung untuk memanggil para gembala pulang segera.",
+    "Lalu turunlah hujan lebat tiga hari tiga malam sehingga sungai meluap.",
+]
+
+
+def chapter_rows(book: str, texts: List[str]) -> List[Dict[str, str]]:
+    return [
+        {"book_name": book, "chapter": "4", "verse": str(verse), "text": text, "pericope": ""}
+        for verse, text in enumerate(texts, start=1)
+    ]
+
+
+def settings() -> tb2.AlignSettings:
+    return tb2.AlignSettings(0.82, 0.82, 6, "difflib")
+
+
+def test_close_chapter_is_aligned_as_a_whole() -> None:
+    tb1_index = tb2.index_tb1_rows(chapter_rows("Tobit", TB1_VERSES))
+    rows = chapter_rows("Tobit", TB2_SHIFTED)
+    stats = tb2.Stats()
+
+    alignments = tb2.prepare_chapter_alignments(rows, tb1_index, "difflib", stats)
+
+    assert sorted(alignments) == list(range(len(rows)))
+    assert stats.chapters_over_edit_budget == 0
+    plan = tb2.plan_row(rows[1], 1, settings(), tb1_index, {}, alignments, stats)
+    assert plan.method == "alignment_chapter"
+    assert plan.ref is not None and plan.ref.verse == 1
+    assert plan.chapter_text == "Maka berkatalah Tobit kepada anaknya, katanya: Dengarkanlah perkataanku ini."
+
+
+def test_divergent_chapter_falls_back_to_verse_alignment() -> None:
+    tb1_index = tb2.index_tb1_rows(chapter_rows("Tobit", TB1_VERSES))
+    rows = chapter_rows("Tobit", TB2_DIVERGENT)
+
+    for engine in tb2.ALIGN_ENGINES:
+        stats = tb2.Stats()
+        assert tb2.align_chapter([row["text"] for row in rows], tb1_index[("Tobit", "4")], engine) is None
+        alignments = tb2.prepare_chapter_alignments(rows, tb1_index, engine, stats)
+        assert alignments == {}
+        assert stats.chapters_over_edit_budget == 1
+
+    plan = tb2.plan_row(rows[0], 0, settings(), tb1_index, {}, {}, tb2.Stats())
+    assert plan.method == "fallback"
+    assert plan.chapter_text is None
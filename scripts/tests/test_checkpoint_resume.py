@@ -0,0 +1,138 @@
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+FIELDS = ["book_name", "grouping", "order_index", "chapter", "verse", "text", "pericope"]
+
+TB1_TEXT = {
+    ("Tobit", "1"): [
+        "Kitab kisah Tobit bin Tobiel dari suku Naftali.",
+        "Tobit diangkut tertawan dari Tisbe di Galilea atas.",
+        "Aku, Tobit, menempuh jalan kebenaran seumur hidupku.",
+    ],
+    ("Tobit", "2"): [
+        "Pada pesta Pentakosta disiapkan bagiku makanan yang baik.",
+        "Lalu aku berkata kepada Tobia, anakku: Pergilah mencari orang miskin.",
+        "Tetapi ia kembali dan berkata: Bapa, seorang dari bangsa kita dibunuh.",
+    ],
+    ("Yudit", "1"): [
+        "Pada tahun kedua belas pemerintahan Nebukadnezar ia meraja atas orang Asyur.",
+        "Ia membangun tembok sekeliling Ekbatana dari batu pahat.",
+        "Menara-menaranya didirikannya di pintu gerbang kota itu.",
+    ],
+}
+
+# TB2 rows: syllable-split copies, one fast-path row, and one fallback row.
+TB2_TEXT = {
+    ("Tobit", "1"): [
+        "Kitab kisah To bit bin To biel dari su ku Naf ta li.",
+        "Tobit diangkut tertawan dari Tisbe di Galilea atas.",
+        "Aku, To bit, menem puh jalan ke benar an se umur hidup ku.",
+    ],
+    ("Tobit", "2"): [
+        "Pada pes ta Pen ta kosta di siap kan bagi ku makan an yang baik.",
+        "Lalu aku ber kata kepada To bia, anak ku: Pergi lah mencari orang mis kin.",
+        "Sung guh ter lalu jauh ja lan ke se be rang sa na.",
+    ],
+    ("Yudit", "1"): [
+        "Pada ta hun ke dua be las pe me rin tah an Ne bu kad nezar ia me raja atas orang Asyur.",
+        "Ia mem ba ngun tem bok se ke liling Ek ba tana dari batu pa hat.",
+        "Menara-menara nya di diri kan nya di pintu ger bang kota itu.",
+    ],
+}
+
+
+def write_csv(path: Path, chapters: Dict[Any, List[str]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS)
+        writer.writeheader()
+        for (book, chapter), texts in chapters.items():
+            for verse, text in enumerate(texts, start=1):
+                writer.writerow(
+                    {
+                        "book_name": book,
+                        "grouping": "deutero",
+                        "order_index": "17",
+                        "chapter": chapter,
+                        "verse": str(verse),
+                        "text": text,
+                        "pericope": "",
+                    }
+                )
+
+
+@pytest.fixture
+def run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., Dict[str, Any]]:
+    write_csv(tmp_path / "tb1.csv", TB1_TEXT)
+    write_csv(tmp_path / "tb2.csv", TB2_TEXT)
+
+    def run_main(name: str, *extra: str) -> Dict[str, Any]:
+        argv = [
+            "clean_tb2_syllable_spacing.py",
+            "--tb1-csv", str(tmp_path / "tb1.csv"),
+            "--tb2-csv", str(tmp_path / "tb2.csv"),
+            "--out-csv", str(tmp_path / f"{name}.csv"),
+            "--summary-json", str(tmp_path / f"{name}.json"),
+            "--no-tb1-cache",
+            "--checkpoint-every", "1",
+            *extra,
+        ]  # fmt: skip
+        monkeypatch.setattr(sys, "argv", argv)
+        tb2.main()
+        return json.loads((tmp_path / f"{name}.json").read_text(encoding="utf-8"))
+
+    return run_main
+
+
+def interrupt_on_call(monkeypatch: pytest.MonkeyPatch, owner: Any, name: str, call: int) -> None:
+    original = getattr(owner, name)
+    calls = 0
+
+    def interrupting(*args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == call:
+            raise KeyboardInterrupt
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, interrupting)
+
+
+def without_paths(summary: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in summary.items() if key not in ("output_csv", "tb1_cache")}
+
+
+@pytest.mark.parametrize(
+    "owner, name, calls",
+    [(tb2, "tally_row", range(1, 10)), (tb2.Stats, "merge", range(1, 4))],
+)
+def test_interrupted_run_resumes_to_the_same_output(
+    run: Callable[..., Dict[str, Any]],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    owner: Any,
+    name: str,
+    calls: range,
+) -> None:
+    expected = run("full")
+    expected_csv = (tmp_path / "full.csv").read_bytes()
+    assert expected["rows"]["total"] == 9
+
+    for call in calls:
+        with monkeypatch.context() as patch:
+            interrupt_on_call(patch, owner, name, call)
+            with pytest.raises(SystemExit, match="Interrupted"):
+                run(f"cut{call}")
+        capsys.readouterr()
+        summary = run(f"cut{call}", "--resume")
+        # Resume notices go to stderr, so stdout is just the summary JSON.
+        assert json.loads(capsys.readouterr().out) == summary
+        assert without_paths(summary) == without_paths(expected), (name, call)
+        assert (tmp_path / f"cut{call}.csv").read_bytes() == expected_csv, (name, call)
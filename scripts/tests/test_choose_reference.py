@@ -0,0 +1,88 @@
+import random
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+BASE = (
+    "maka berkatalah tobit kepada anaknya dengarkanlah perkataanku ini apabila aku mati "
+    "kuburkanlah aku dengan layak dan hormatilah ibumu seumur hidupmu"
+)
+
+
+def perturb(text: str, edits: int, rng: random.Random) -> str:
+    letters = list(text)
+    for _ in range(edits):
+        position = rng.randrange(len(letters))
+        action = rng.random()
+        if action < 0.4:
+            letters[position] = rng.choice("aeiouklmnst")
+        elif action < 0.7:
+            del letters[position]
+        else:
+            letters.insert(position, rng.choice("aeiouklmnst"))
+    return "".join(letters)
+
+
+def unpruned(
+    tb2_norm: str, ref_rows: Dict[int, tb2.RowRef], verse: int, min_direct: float, min_neighbor: float, window: int
+) -> Tuple[Optional[tb2.RowRef], str, float]:
+    """choose_reference() without the length and letter-multiset bounds: every candidate gets difflib."""
+    direct = ref_rows.get(verse)
+    best_ref, best_ratio, best_mode = direct, tb2.sequence_ratio(tb2_norm, direct.normalized) if direct else 0.0, "same"
+    if direct is not None and best_ratio >= min_direct:
+        return direct, "same", best_ratio
+    for candidate_verse in range(max(1, verse - window), verse + window + 1):
+        candidate = ref_rows.get(candidate_verse)
+        if candidate_verse == verse or candidate is None:
+            continue
+        ratio = tb2.sequence_ratio(tb2_norm, candidate.normalized)
+        if ratio > best_ratio:
+            best_ref, best_ratio, best_mode = candidate, ratio, "neighbor"
+    if best_ref is not None and best_mode == "neighbor" and best_ratio >= min_neighbor:
+        return best_ref, best_mode, best_ratio
+    return None, "none", best_ratio
+
+
+def chapter(seed: int) -> Tuple[str, Dict[int, tb2.RowRef]]:
+    """A TB2 verse and a TB1 chapter of near copies around the 0.82 threshold, plus decoys."""
+    rng = random.Random(seed)
+    rows = []
+    for verse in range(1, 14):
+        kind = rng.random()
+        if kind < 0.6:
+            # Edited copies: ratios land from about 0.7 to 0.95.
+            text = perturb(BASE, rng.randint(4, 30), rng)
+        elif kind < 0.8:
+            # Much shorter or longer: the length bound rules these out.
+            text = BASE[: rng.randint(10, 40)] if rng.random() < 0.5 else BASE * 2
+        else:
+            # Same length, other letters: the letter-multiset bound rules these out.
+            text = "".join(rng.choice("bcdfghjpqrvwxyz") for _ in BASE)
+        rows.append({"book_name": "Tobit", "chapter": "4", "verse": str(verse), "text": text})
+    index = tb2.index_tb1_rows(rows)[("Tobit", "4")]
+    return tb2.normalize_letters(perturb(BASE, rng.randint(0, 12), rng)), index
+
+
+@pytest.mark.parametrize("min_direct, min_neighbor", [(0.82, 0.82), (0.9, 0.85), (0.99, 0.75)])
+def test_pruning_keeps_the_chosen_reference_and_ratio(min_direct: float, min_neighbor: float) -> None:
+    stats = tb2.Stats()
+    neighbor_wins = 0
+    for seed in range(150):
+        tb2_norm, index = chapter(seed)
+        verse = 1 + seed % 13
+        expected = unpruned(tb2_norm, index, verse, min_direct, min_neighbor, 6)
+
+        ref, mode, ratio = tb2.choose_reference(tb2_norm, index, verse, min_direct, min_neighbor, 6, stats=stats)
+
+        assert (ref.verse if ref else None, mode, ratio) == (
+            expected[0].verse if expected[0] else None,
+            expected[1],
+            expected[2],
+        ), seed
+        neighbor_wins += mode == "neighbor"
+
+    # Both bounds fired and neighbors still won, so the cases above exercised the pruning.
+    assert stats.neighbor_pruned_length and stats.neighbor_pruned_letters
+    assert neighbor_wins
@@ -0,0 +1,149 @@
+import random
+import re
+from typing import List
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+LETTER_CLASS = tb2.LETTER_CLASS
+
+# remove_cross_reference_noise() as it was before the single-pass scan: from
+# every ref/book/number token, grow a span and test it, then run both cleanup
+# regexes unconditionally.
+BASELINE_TOKEN_RE = re.compile(
+    rf"""\s+|"""
+    rf"""\d{{1,3}}:\d{{1,3}}(?:-\d{{1,3}}(?::\d{{1,3}})?)?|"""
+    rf"""\d{{1,3}}-\d{{1,3}}|"""
+    rf"""(?:[1-3]?)[{LETTER_CLASS}]+\.?|"""
+    rf"""\d+|"""
+    rf"""[;,.:!?()\[\]"'/-]|."""
+)
+CITATION_REF_RE = re.compile(r"^\d{1,3}:\d{1,3}(?:-\d{1,3}(?::\d{1,3})?)?$")
+CITATION_CONT_RE = re.compile(r"^\d{1,3}(?:-\d{1,3})?$")
+CITATION_BOOK_TOKEN_RE = re.compile(rf"^(?:[1-3]?)[{LETTER_CLASS}]+\.?$")
+SEPARATORS = {",", ";", ":", ".", "!", "?", "(", ")", "[", "]", '"', "'", "/", "-"}
+
+
+def is_reference_book_token(token: str) -> bool:
+    if not CITATION_BOOK_TOKEN_RE.fullmatch(token):
+        return False
+    return token.rstrip(".") in tb2.REFERENCE_BOOK_ABBRS
+
+
+def baseline_remove_cross_reference_noise(text: str) -> str:
+    tokens = BASELINE_TOKEN_RE.findall(text)
+    if not tokens:
+        return text
+
+    remove = [False] * len(tokens)
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.isspace():
+            i += 1
+            continue
+        if not (CITATION_REF_RE.fullmatch(token) or is_reference_book_token(token) or CITATION_CONT_RE.fullmatch(token)):
+            i += 1
+            continue
+
+        j = i
+        ref_count = book_count = cont_count = sep_count = nonspace_count = 0
+        prev_kind = ""
+        while j < len(tokens):
+            current = tokens[j]
+            if current.isspace():
+                j += 1
+                continue
+            if CITATION_REF_RE.fullmatch(current):
+                ref_count += 1
+                prev_kind = "ref"
+            elif is_reference_book_token(current):
+                book_count += 1
+                prev_kind = "book"
+            elif current in SEPARATORS:
+                sep_count += 1
+                prev_kind = "sep"
+            elif CITATION_CONT_RE.fullmatch(current) and prev_kind in {"sep", "ref", "book", "cont"}:
+                cont_count += 1
+                prev_kind = "cont"
+            else:
+                break
+            nonspace_count += 1
+            j += 1
+
+        looks_like_reference = (
+            (ref_count >= 2 and (book_count >= 1 or cont_count >= 1))
+            or (book_count >= 1 and ref_count >= 1 and sep_count >= 1 and nonspace_count >= 5)
+            or (ref_count >= 3)
+        )
+        if looks_like_reference:
+            for idx in range(i, j):
+                remove[idx] = True
+            i = j
+            continue
+        i += 1
+
+    cleaned = "".join(token for idx, token in enumerate(tokens) if not remove[idx])
+    cleaned = tb2.REFERENCE_PARENS_RE.sub("", cleaned)
+    cleaned = tb2.MALFORMED_HEAD_REF_RE.sub("", cleaned)
+    return tb2.REFERENCE_PUNCTUATION(cleaned)
+
+
+CITATION_ROWS = [
+    # Several citations in a row, with and without book names.
+    "Lalu Tuhan berfirman kepada Musa. Kej 1:2; 3:4-5, Kel 2:1 Dan Musa pergi.",
+    "Kej 1:1; Yoh 1:1-3; Ibr 11:3 Pada mulanya Allah menciptakan langit dan bumi.",
+    "Berbahagialah orang yang miskin. Mat 5:3; Luk 6:20; Yak 2:5; 1Kor 1:26-28 Berbahagialah orang yang berdukacita.",
+    "Ia berkata: 1:2; 3:4; 5:6 demikianlah firman Tuhan.",
+    "Kel 20:12 Ul 5:16 Ef 6:2-3 Hormatilah ayahmu dan ibumu.",
+    # A citation closing the verse.
+    "Hormatilah ayahmu dan ibumu, supaya lanjut umurmu. Kel 20:12; Ul 5:16",
+    "Sebab demikianlah ada tertulis: Yes 40:3; Mal 3:1.",
+    "dan mereka semua makan sampai kenyang Mat 14:20, 15:37; Mrk 6:42",
+    # Parenthesized and malformed heads.
+    "Maka jawab Yesus (Mat 4:4; Ul 8:3) kepadanya: Ada tertulis.",
+    "1:5: Kej Lalu berkatalah Tuhan kepadanya.",
+    # Numbers and book-like words that are not citations.
+    "Ada 12 suku dan 3:4 bagian dari tanah itu.",
+    "Kisah Para Rasul 2 menceritakan hal itu, Ams 3 juga.",
+    "Pada tahun 1-2 pemerintahannya ia membangun Yer.",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", CITATION_ROWS)
+def test_single_pass_matches_the_baseline_on_citation_rows(text: str) -> None:
+    assert tb2.remove_cross_reference_noise(text) == baseline_remove_cross_reference_noise(text)
+
+
+def random_row(rng: random.Random, books: List[str]) -> str:
+    pieces: List[str] = []
+    for _ in range(rng.randint(1, 14)):
+        roll = rng.random()
+        if roll < 0.3:
+            pieces.append(rng.choice(["Lalu", "berkata", "Tuhan", "kepada", "Musa", "dan", "ia", "pergi"]))
+        elif roll < 0.5:
+            pieces.append(rng.choice(books))
+        elif roll < 0.7:
+            chapter, verse = rng.randint(1, 150), rng.randint(1, 40)
+            pieces.append(f"{chapter}:{verse}" + rng.choice(["", f"-{verse + 3}", f"-{chapter + 1}:2"]))
+        elif roll < 0.8:
+            pieces.append(rng.choice([str(rng.randint(1, 999)), f"{rng.randint(1, 9)}-{rng.randint(10, 20)}"]))
+        else:
+            pieces.append(rng.choice([";", ",", ".", ":", "(", ")", "/", "-", "—", "1:2:", "Kej."]))
+    return "".join(piece + rng.choice([" ", " ", "", "  ", "\n"]) for piece in pieces)
+
+
+def test_single_pass_matches_the_baseline_on_random_citation_rows() -> None:
+    rng = random.Random(19)
+    books = sorted(tb2.REFERENCE_BOOK_ABBRS)
+    changed = 0
+    for _ in range(3000):
+        text = random_row(rng, books)
+        cleaned = tb2.remove_cross_reference_noise(text)
+
+        assert cleaned == baseline_remove_cross_reference_noise(text), text
+        changed += cleaned != tb2.REFERENCE_PUNCTUATION(text)
+    # Over a quarter of the rows lose a citation, so the comparison is not vacuous.
+    assert changed > 500
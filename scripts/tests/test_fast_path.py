@@ -0,0 +1,104 @@
+import csv
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+TB1_VERSES = [
+    "Maka berkatalah Tobit kepada anaknya, katanya: Dengarkanlah perkataanku ini.",
+    "Apabila aku mati, kuburkanlah aku dengan layak dan hormatilah ibumu seumur hidupmu.",
+    "Lakukanlah apa yang berkenan kepadanya dan jangan menyedihkan hatinya.",
+    "Ingatlah akan Tuhan setiap hari dan jangan berbuat dosa atau melanggar perintah-Nya.",
+    "Berbuatlah kebajikan seumur hidupmu dan janganlah menempuh jalan kelaliman.",
+    "Sebab orang yang berpegang pada kebenaran akan berhasil dalam segala pekerjaannya.",
+]
+
+
+def fast_path_variants(rng: random.Random, text: str) -> List[str]:
+    """TB2 spellings of a TB1 verse with its letters and a subset of its word boundaries."""
+    words = text.split(" ")
+    variants = [text, text.upper(), text.lower(), text.replace(", ", " , ").replace(":", " :")]
+    for _ in range(6):
+        # Drop some spaces: merged words keep every remaining boundary a TB1 one.
+        merged = words[0]
+        for word in words[1:]:
+            merged += (" " if rng.random() < 0.6 else "") + word
+        variants.append(merged)
+    variants.append(text.replace("perintah-Nya", "perintah Nya").replace(" ", "  "))
+    variants.append(text + " Kej 1:2; 3:4-5, Kel 2:1")
+    return variants
+
+
+def chapter_rows(texts: List[str]) -> List[Dict[str, str]]:
+    return [
+        {"book_name": "Tobit", "chapter": "4", "verse": str(verse), "text": text, "pericope": ""}
+        for verse, text in enumerate(texts, start=1)
+    ]
+
+
+@pytest.mark.parametrize("engine", tb2.ALIGN_ENGINES)
+def test_fast_path_rows_match_the_full_alignment(engine: str) -> None:
+    tb1_rows = chapter_rows(TB1_VERSES)
+    tb1_index = tb2.index_tb1_rows(tb1_rows)
+    lexicon, hyphen_lookup = tb2.build_tb1_lexicon(tb1_rows)
+    scorer = tb2.FallbackScorer(lexicon)
+    fast = tb2.AlignSettings(0.82, 0.82, 6, engine)
+    full = tb2.AlignSettings(0.82, 0.82, 6, engine, fast_path=False)
+    rng = random.Random(20)
+
+    fast_rows = 0
+    for verse, text in enumerate(TB1_VERSES, start=1):
+        for variant in fast_path_variants(rng, text):
+            row = {"book_name": "Tobit", "chapter": "4", "verse": str(verse), "text": variant, "pericope": ""}
+            fast_plan = tb2.plan_row(row, verse - 1, fast, tb1_index, {}, {})
+            full_plan = tb2.plan_row(row, verse - 1, full, tb1_index, {}, {})
+
+            assert not full_plan.fast_path
+            assert (fast_plan.method, fast_plan.confidence, fast_plan.ref) == (
+                full_plan.method,
+                full_plan.confidence,
+                full_plan.ref,
+            ), variant
+            assert tb2.finish_row(fast_plan, fast, scorer, hyphen_lookup) == tb2.finish_row(
+                full_plan, full, scorer, hyphen_lookup
+            ), variant
+            fast_rows += fast_plan.fast_path
+    # All qualify except the cross-reference variants and the split "perintah Nya".
+    assert fast_rows >= 9 * len(TB1_VERSES)
+
+
+def test_no_fast_path_writes_the_same_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(20)
+    # Merged-word variants: all on the fast path.
+    tb2_texts = [fast_path_variants(rng, text)[4] for text in TB1_VERSES]
+    # One row off the fast path, so both kinds are written.
+    tb2_texts[2] = "Laku kan lah apa yang ber kenan kepada nya dan jangan menye dih kan hati nya."
+    for name, texts in (("tb1", TB1_VERSES), ("tb2", tb2_texts)):
+        with (tmp_path / f"{name}.csv").open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["book_name", "chapter", "verse", "text", "pericope"])
+            writer.writeheader()
+            writer.writerows(chapter_rows(texts))
+
+    summaries = {}
+    for name, extra in (("fast", []), ("full", ["--no-fast-path"])):
+        argv = [
+            "clean_tb2_syllable_spacing.py",
+            "--tb1-csv", str(tmp_path / "tb1.csv"),
+            "--tb2-csv", str(tmp_path / "tb2.csv"),
+            "--out-csv", str(tmp_path / f"{name}.csv"),
+            "--summary-json", str(tmp_path / f"{name}.json"),
+            "--no-tb1-cache",
+            *extra,
+        ]  # fmt: skip
+        monkeypatch.setattr(sys, "argv", argv)
+        tb2.main()
+        summaries[name] = json.loads((tmp_path / f"{name}.json").read_text(encoding="utf-8"))
+
+    assert (tmp_path / "fast.csv").read_bytes() == (tmp_path / "full.csv").read_bytes()
+    assert summaries["fast"]["rows"]["fast_path"] == len(TB1_VERSES) - 1
+    assert summaries["full"]["rows"]["fast_path"] == 0
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+import letter_alignment
+
+VERSE = (
+    "Apabila aku mati, kuburkanlah aku dengan layak dan hormatilah ibumu seumur hidupmu. Lakukanlah apa "
+    "yang berkenan kepadanya dan jangan menyedihkan hatinya. Ingatlah, anakku, bahwa ia telah menanggung "
+    "banyak bahaya karena engkau selagi engkau masih di dalam kandungannya."
+)
+
+CASES = {
+    # Several verses run together, syllable-split, with a few changed words.
+    "long_verse": (
+        " ".join([VERSE] * 4),
+        " ".join(
+            [
+                "Apa bila aku mati, kubur kan lah aku dengan la yak dan hormati lah ibu mu seumur hidup mu.",
+                "Laku kan lah apa yang ber kenan kepada nya dan jangan menye dih kan hati nya. Ingat lah,",
+                "anak ku, bahwa ia sudah menanggung banyak bahaya karena eng kau selagi engkau di dalam",
+                "kandung an nya.",
+            ]
+            * 4
+        ),
+    ),
+    # Runs that occur more than once in one or both texts, where the first
+    # copy and the longest match disagree.
+    "repeated_substrings": (
+        "Kuduskanlah, kuduskanlah, kuduskanlah Tuhan semesta alam; seluruh bumi penuh kemuliaan-Nya.",
+        "Kudus kan lah, kudus kan lah Tuhan se mesta alam, kudus kan lah; se luruh bumi penuh ke mulia an-Nya.",
+    ),
+    "duplicated_phrase": (
+        "Lalu berkatalah ia kepada mereka: Pergilah kamu ke kota dan katakanlah kepada mereka apa yang kamu lihat.",
+        "Lalu ber kata lah ia kepada mereka: Pergi lah kamu ke kota dan kata kan lah kepada mereka: Pergi lah "
+        "kamu ke kota dan kata kan lah kepada mereka apa yang kamu lihat.",
+    ),
+    # Cross-reference noise and a repeated heading stuck to the verse end.
+    "trailing_noise": (
+        VERSE,
+        "Apa bila aku mati, kubur kan lah aku dengan la yak dan hormati lah ibu mu seumur hidup mu. Laku kan "
+        "lah apa yang ber kenan kepada nya dan jangan menye dih kan hati nya. Ingat lah, anak ku, bahwa ia "
+        "telah menanggung banyak bahaya karena eng kau selagi eng kau masih di dalam kandung an nya. Bdk. Kel "
+        "20:12; Ul 5:16; Ams 23:22 Nasihat Tobit kepada Tobia Apa bila aku mati",
+    ),
+}
+
+
+@pytest.mark.parametrize("tb2_text, ref_text", CASES.values(), ids=list(CASES))
+def test_anchors_projects_the_same_boundaries_as_difflib(tb2_text: str, ref_text: str) -> None:
+    stream2 = tb2.normalize_letters(tb2_text)
+    stream_ref = tb2.normalize_letters(ref_text)
+
+    assert letter_alignment.anchor_blocks(stream2, stream_ref) == letter_alignment.difflib_blocks(stream2, stream_ref)
+    assert tb2.project_boundaries(tb2_text, ref_text, "anchors") == tb2.project_boundaries(tb2_text, ref_text)
+
+
+def edited(rng: random.Random, text: str, alphabet: str) -> str:
+    letters = list(text)
+    for _ in range(rng.randint(0, 10)):
+        if not letters:
+            break
+        position = rng.randrange(len(letters))
+        action = rng.random()
+        if action < 0.3:
+            letters[position] = rng.choice(alphabet)
+        elif action < 0.6:
+            del letters[position]
+        elif action < 0.8:
+            # Copy the stretch just before, so runs repeat.
+            letters[position:position] = letters[max(0, position - 15) : position]
+        else:
+            letters.insert(position, rng.choice(alphabet))
+    return "".join(letters)
+
+
+@pytest.mark.parametrize("size", [1, 3, letter_alignment.ANCHOR_SIZE])
+def test_anchor_blocks_match_difflib_on_random_streams(size: int) -> None:
+    rng = random.Random(size)
+    for case in range(1500):
+        # Two- and five-letter alphabets make ties and repeats common.
+        alphabet = "ab" if case % 3 == 0 else "abcde"
+        a = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        b = edited(rng, a, alphabet)
+
+        assert letter_alignment.anchor_blocks(a, b, size) == letter_alignment.difflib_blocks(a, b), (a, b)
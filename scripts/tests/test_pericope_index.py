@@ -0,0 +1,81 @@
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+TB1_CSV = FIXTURES / "tb1_pericopes.csv"
+TB2_CSV = FIXTURES / "tb2_pericopes.csv"
+
+
+def pericope_index() -> Dict[Tuple[str, str, int], tb2.RowRef]:
+    return tb2.index_tb1_pericopes(tb2.load_rows(TB1_CSV))
+
+
+def test_index_keys_headings_by_the_verse_they_stand_before() -> None:
+    index = pericope_index()
+
+    assert sorted(index) == [("Tobit", "1", 1), ("Tobit", "1", 3), ("Tobit", "2", 1)]
+    heading = index[("Tobit", "1", 3)]
+    assert heading.verse == 3
+    assert heading.text == "Kesalehan Tobit di pembuangan"
+    assert heading.normalized == "kesalehantobitdipembuangan"
+
+
+def test_syllabified_heading_matches_its_tb1_heading() -> None:
+    index = pericope_index()
+
+    ref = tb2.choose_pericope_reference("To bit yang sa leh", index, "Tobit", "1", [1], 0.82)
+
+    assert ref is index[("Tobit", "1", 1)]
+
+
+def test_extra_and_reworded_headings_are_unmatched() -> None:
+    index = pericope_index()
+
+    # TB1 has no heading before verse 2.
+    assert tb2.choose_pericope_reference("Per jalan an ke Ni ni we", index, "Tobit", "1", [2], 0.82) is None
+    # TB1 has a heading before verse 3, but it says something else.
+    assert tb2.choose_pericope_reference("Tobit di Niniwe", index, "Tobit", "1", [3], 0.82) is None
+
+
+def test_shifted_heading_follows_the_chosen_verse() -> None:
+    index = pericope_index()
+
+    # TB2 2:2 aligns with TB1 2:1, so that heading is tried after the direct one.
+    assert tb2.choose_pericope_reference("To bit men ja di bu ta", index, "Tobit", "2", [2], 0.82) is None
+    ref = tb2.choose_pericope_reference("To bit men ja di bu ta", index, "Tobit", "2", [2, 1], 0.82)
+    assert ref is index[("Tobit", "2", 1)]
+
+
+def test_cleaned_headings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    out_csv = tmp_path / "tb2_clean.csv"
+    summary_json = tmp_path / "summary.json"
+    argv = [
+        "clean_tb2_syllable_spacing.py",
+        "--tb1-csv", str(TB1_CSV),
+        "--tb2-csv", str(TB2_CSV),
+        "--out-csv", str(out_csv),
+        "--summary-json", str(summary_json),
+        "--no-tb1-cache",
+    ]  # fmt: skip
+    monkeypatch.setattr(sys, "argv", argv)
+
+    tb2.main()
+
+    summary = json.loads(summary_json.read_text(encoding="utf-8"))
+    assert summary["pericopes"] == {"tb1_headings": 3, "aligned_to_tb1_heading": 2, "no_matching_heading": 2}
+    with out_csv.open(encoding="utf-8", newline="") as handle:
+        rows: List[Dict[str, str]] = list(csv.DictReader(handle))
+    pericopes = {(row["chapter"], row["verse"]): row["pericope"] for row in rows if row["pericope"]}
+    assert pericopes[("1", "1")] == "Tobit yang saleh"
+    assert pericopes[("2", "2")] == "Tobit menjadi buta"
+    # Unmatched headings never take TB1 wording.
+    tb1_headings = {heading.text for heading in pericope_index().values()}
+    assert pericopes[("1", "3")] == "Tobit di Niniwe"
+    assert pericopes[("1", "2")] not in tb1_headings
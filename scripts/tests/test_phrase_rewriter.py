@@ -0,0 +1,111 @@
+import random
+import re
+from collections import Counter
+from typing import List, Tuple
+
+import pytest
+
+import clean_tb2_syllable_spacing as tb2
+
+# The rules as the cleaner applied them before PhraseRewriter: one regex per
+# phrase, each run over the whole text in list order, up to four passes.
+SEQUENTIAL_RULES: List[Tuple["re.Pattern[str]", str]] = [
+    (re.compile(r"\b" + r"\s+".join(re.escape(word) for word in phrase.split()) + r"\b", re.IGNORECASE), replacement)
+    for phrase, replacement in tb2.STATIC_SAFE_PHRASE_FIXES
+]
+
+
+def sequential_fixes(text: str) -> str:
+    fixed = text
+    for _ in range(4):
+        prev = fixed
+        for pattern, replacement in SEQUENTIAL_RULES:
+            fixed = pattern.sub(replacement, fixed)
+        if fixed == prev:
+            break
+    return fixed
+
+
+WORDS = sorted(
+    {word for phrase, _ in tb2.STATIC_SAFE_PHRASE_FIXES for word in phrase.split()}
+    | {replacement for _, replacement in tb2.STATIC_SAFE_PHRASE_FIXES}
+)
+SEPARATORS = [" ", " ", "  ", "\t", "\n", "\xa0", ", ", "-", "_", " 3 ", "", "'"]
+
+
+def folded_variant(rng: random.Random, word: str) -> str:
+    """word with random capitals and the letters IGNORECASE folds but str.lower() does not."""
+    word = "".join(letter.upper() if rng.random() < 0.2 else letter for letter in word)
+    if rng.random() < 0.3:
+        word = word.replace("I", "İ")
+    if rng.random() < 0.1:
+        word = word.replace("i", "ı")
+    if rng.random() < 0.1:
+        word = word.replace("s", "ſ")
+    if rng.random() < 0.1:
+        word = word.replace("k", "K")
+    return word
+
+
+def random_text(rng: random.Random) -> str:
+    """Rule phrases, spare words and noise, so phrases overlap and half-match."""
+    words: List[str] = []
+    for _ in range(rng.randint(1, 6)):
+        roll = rng.random()
+        if roll < 0.6:
+            words += rng.choice(tb2.STATIC_SAFE_PHRASE_FIXES)[0].split()
+        elif roll < 0.9:
+            words.append(rng.choice(WORDS))
+        else:
+            words.append(rng.choice(["x", "Tuhan", "1", "é", "ke3"]))
+    text = folded_variant(rng, words[0])
+    for word in words[1:]:
+        text += (" " if rng.random() < 0.7 else rng.choice(SEPARATORS)) + folded_variant(rng, word)
+    return text
+
+
+ADVERSARIAL = [
+    # Overlapping rules: longer and shorter phrases over the same words.
+    "ke pada nya ke pada ke padanya ke padaku",
+    "per sem bah an per sem bah kan sem bah an sem bah",
+    "ke raja an ke raja annya ke raja",
+    # A rewrite that creates a match for an earlier rule on the next pass.
+    "me me gang ber di ri di ri nya di rinya",
+    "demi kian demi kianlah demi kian lah",
+    "ber di\tri\nper buat an per buat",
+    # Case folding: dotted/dotless i, long s, Kelvin sign.
+    "KE PADA NYA, Ke Pada, kE pAdA",
+    "dİ rİ, dı rı, Dİ Rİ nya",
+    "ſi apa, ſem bah, per ſem bah an",
+    "Ke pada, KE DUA, laKu Kan",
+    # Near misses: word characters glued on, or other separators.
+    "kepada ke-pada ke_pada ke3 pada xke pada ke padax",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", ADVERSARIAL)
+def test_rewriter_matches_the_sequential_regex_chain_on_overlaps(text: str) -> None:
+    assert tb2.apply_static_safe_phrase_fixes(text) == sequential_fixes(text)
+
+
+def test_rewriter_matches_the_sequential_regex_chain_on_random_text() -> None:
+    rng = random.Random(18)
+    changed = 0
+    for _ in range(5000):
+        text = random_text(rng)
+        fixed = tb2.apply_static_safe_phrase_fixes(text)
+
+        assert fixed == sequential_fixes(text), text
+        changed += fixed != text
+    # Most texts hit at least one rule, so the comparison is not vacuous.
+    assert changed > 2500
+
+
+def test_fired_counts_every_replacement() -> None:
+    fired: Counter[str] = Counter()
+
+    assert tb2.apply_static_safe_phrase_fixes("ke pada nya, ke pada Tuhan, ke pada", fired) == (
+        "kepadanya, kepada Tuhan, kepada"
+    )
+    assert fired == Counter({"ke pada nya": 1, "ke pada": 2})
@@ -0,0 +1,141 @@
+"""
+Shared whitespace and punctuation spacing rules for the Bible text scripts.
+
+The cleaners used to chain five to seven re.sub calls over every string. A
+SpacingNormalizer compiles one script's rules into a single alternation, so
+each string is scanned once in C and only whitespace that actually needs a
+fix reaches the replacement callback. The profiles at the bottom reproduce
+the former per-script chains exactly.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional
+
+# Character fixes for PDF text layers; str.translate does them in one pass.
+SPACE_TRANSLATION = str.maketrans(
+    {
+        "\r": None,
+        "\u00a0": " ",
+        "\u202f": " ",
+        "\u2009": " ",
+        "\u00ad": None,
+        "ﬁ": "fi",
+        "ﬂ": "fl",
+    }
+)
+TYPOGRAPHIC_TRANSLATION = str.maketrans(
+    {
+        "\r": None,
+        "\u00a0": " ",
+        "\u202f": " ",
+        "\u2009": " ",
+        "”": '"',
+        "“": '"',
+        "’": "'",
+        "‘": "'",
+        "—": "-",
+        "–": "-",
+        "\u00ad": None,
+        "ﬁ": "fi",
+        "ﬂ": "fl",
+    }
+)
+PDF_SPAN_TRANSLATION = str.maketrans(
+    {
+        "\u00a0": " ",
+        "\u2007": " ",
+        "”": '"',
+        "“": '"',
+        "’": "'",
+        "‘": "'",
+        "—": "-",
+        "–": "-",
+    }
+)
+
+
+class SpacingNormalizer:
+    """
+    Rules, in the precedence they had as separate substitutions:
+    - colon_quote: exactly one space between ":" and a following quote,
+    - drop_hyphen_before: remove "-" (and surrounding whitespace) before these chars,
+    - drop_before: remove whitespace before these chars,
+    - drop_after: remove whitespace after these chars,
+    - collapse: other whitespace runs become one space; with collapse_single=False
+      a lone non-space whitespace char is left as is.
+    The result is stripped, then stripped of strip_chars when given.
+    """
+
+    def __init__(
+        self,
+        *,
+        drop_before: str = "",
+        drop_after: str = "",
+        drop_hyphen_before: str = "",
+        colon_quote: bool = False,
+        collapse_single: bool = True,
+        strip_chars: Optional[str] = None,
+    ) -> None:
+        parts = []
+        if colon_quote:
+            parts.append(r"""(?P<colon_quote>(?<=:)\s*(?=["']))""")
+        if drop_hyphen_before:
+            parts.append(rf"(?P<hyphen>\s*-\s*(?=[{re.escape(drop_hyphen_before)}]))")
+        if drop_before:
+            parts.append(rf"(?P<before>\s+(?=[{re.escape(drop_before)}]))")
+        if drop_after:
+            parts.append(rf"(?P<after>(?<=[{re.escape(drop_after)}])\s+)")
+        parts.append(r"(?P<collapse>\s{2,}|[^\S ])" if collapse_single else r"(?P<collapse>\s{2,})")
+        self.pattern = re.compile("|".join(parts))
+        self.strip_chars = strip_chars
+        self._replacements: Dict[str, str] = {
+            "colon_quote": " ",
+            "hyphen": "",
+            "before": "",
+            "after": "",
+            "collapse": " ",
+        }
+
+    def _replace(self, match: re.Match[str]) -> str:
+        return self._replacements[match.lastgroup or "collapse"]
+
+    def __call__(self, text: str) -> str:
+        cleaned = self.pattern.sub(self._replace, text).strip()
+        if self.strip_chars is not None:
+            cleaned = cleaned.strip(self.strip_chars)
+        return cleaned
+
+
+SENTENCE_PUNCT = ",.;:!?"
+OPEN_BRACKETS = "([{"
+CLOSE_BRACKETS = ")]}"
+QUOTES = "'\""
+
+# clean_bible_import_text.basic_clean
+IMPORT_PUNCTUATION = SpacingNormalizer(
+    drop_before=SENTENCE_PUNCT + CLOSE_BRACKETS + QUOTES,
+    drop_after=OPEN_BRACKETS,
+)
+# clean_tb2_syllable_spacing.normalize_punctuation_spacing
+TB2_PUNCTUATION = SpacingNormalizer(
+    drop_before=SENTENCE_PUNCT + CLOSE_BRACKETS + QUOTES,
+    drop_after=OPEN_BRACKETS,
+    colon_quote=True,
+)
+# Tail of clean_tb2_syllable_spacing.remove_cross_reference_noise
+REFERENCE_PUNCTUATION = SpacingNormalizer(
+    drop_before=SENTENCE_PUNCT + CLOSE_BRACKETS,
+    drop_after=OPEN_BRACKETS,
+    drop_hyphen_before=SENTENCE_PUNCT,
+    collapse_single=False,
+    strip_chars=" ;,",
+)
+# extract_tb2_pdf_text.tokens_to_text
+PDF_TOKEN_PUNCTUATION = SpacingNormalizer(
+    drop_before=SENTENCE_PUNCT + ")",
+    drop_after="(",
+    collapse_single=False,
+)
+COLLAPSE_WHITESPACE = SpacingNormalizer()
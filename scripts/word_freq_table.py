@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Snapshot wordfreq zipf values for a Bible import corpus into a compact table.
+
+Importing wordfreq and warming its id/en tables dominates startup on small
+cleaning batches. This build step looks up every word the cleaners can ask
+about once and stores the non-zero values on disk:
+
+  python3 scripts/word_freq_table.py docs/import/tb2_text_raw.csv --out tmp/word_freq_table.bin
+
+The cleaning scripts accept --freq-table and load it in milliseconds. The
+vocabulary covers every word token plus every join of up to --max-group
+adjacent tokens, so merge candidates resolve to the same value wordfreq
+returns. Strings not in the table score 0.0, as unknown words do in wordfreq.
+
+Table layout (little endian):
+  header   magic "ZIPF", version u16, word count u32, word blob bytes u32
+  words    sorted, UTF-8, newline separated
+  values   one u16 array per language in LANGS, zipf * 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+MAGIC = b"ZIPF"
+VERSION = 1
+HEADER = struct.Struct("<4sHII")
+LANGS = ("id", "en")
+
+LETTER_CLASS = r"A-Za-zÀ-ÖØ-öø-ÿ"
+WORD_RE = re.compile(rf"[{LETTER_CLASS}]+")
+HYPHEN_WORD_RE = re.compile(rf"[{LETTER_CLASS}-]+")
+HYPHEN_BREAK_RE = re.compile(rf"([{LETTER_CLASS}])-\s+([{LETTER_CLASS}])")
+
+ZipfLookup = Callable[[str, str], float]
+
+
+class ZipfTable:
+    def __init__(self, words: List[str], values: Dict[str, array]) -> None:
+        self.words = words
+        self.values = values
+
+    def zipf_frequency(self, word: str, lang: str) -> float:
+        idx = bisect_left(self.words, word)
+        if idx < len(self.words) and self.words[idx] == word:
+            return self.values[lang][idx] / 100.0
+        return 0.0
+
+    @classmethod
+    def load(cls, path: Path) -> "ZipfTable":
+        data = path.read_bytes()
+        magic, version, count, blob_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} zipf table")
+        offset = HEADER.size
+        words = data[offset : offset + blob_size].decode("utf-8").split("\n") if count else []
+        offset += blob_size
+        values: Dict[str, array] = {}
+        for lang in LANGS:
+            column = array("H")
+            column.frombytes(data[offset : offset + count * column.itemsize])
+            offset += count * column.itemsize
+            values[lang] = column
+        return cls(words, values)
+
+    def save(self, path: Path) -> None:
+        blob = "\n".join(self.words).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            handle.write(HEADER.pack(MAGIC, VERSION, len(self.words), len(blob)))
+            handle.write(blob)
+            for lang in LANGS:
+                handle.write(self.values[lang].tobytes())
+
+
+def load_zipf_frequency(table_path: Optional[Path]) -> Tuple[Optional[ZipfLookup], str]:
+    """
+    Return a zipf_frequency(word, lang) callable and the name of its source.
+    A table that was asked for must exist; only without one does this fall
+    back to wordfreq (or to no frequencies at all).
+    """
+    if table_path is not None:
+        if not table_path.exists():
+            raise SystemExit(f"--freq-table {table_path} not found")
+        return ZipfTable.load(table_path).zipf_frequency, "table"
+    try:
+        from wordfreq import zipf_frequency  # type: ignore
+    except Exception:
+        return None, "none"
+    return zipf_frequency, "wordfreq"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build a compact zipf table for Bible import CSVs.")
+    parser.add_argument("input_csv", type=Path, nargs="+", help="CSV files whose vocabulary is snapshotted.")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path("tmp/word_freq_table.bin"),
+        help="Output table path.",
+    )
+    parser.add_argument(
+        "--max-group",
+        type=int,
+        default=5,
+        help="Longest run of adjacent tokens joined into a candidate word.",
+    )
+    return parser.parse_args()
+
+
+def iter_texts(paths: Sequence[Path]) -> Iterator[str]:
+    for path in paths:
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                for field in ("text", "pericope"):
+                    text = row.get(field) or ""
+                    if text:
+                        yield text.replace("\u00ad", "").replace("ﬁ", "fi").replace("ﬂ", "fl")
+
+
+def candidate_words(texts: Iterable[str], max_group: int) -> Set[str]:
+    candidates: Set[str] = set()
+    for text in texts:
+        for variant in (text, HYPHEN_BREAK_RE.sub(r"\1\2", text)):
+            for token_re in (WORD_RE, HYPHEN_WORD_RE):
+                tokens = [token.lower() for token in token_re.findall(variant)]
+                n = len(tokens)
+                for i in range(n):
+                    joined = ""
+                    for k in range(min(max_group, n - i)):
+                        joined += tokens[i + k]
+                        candidates.add(joined)
+    return candidates
+
+
+def build_table(words: Iterable[str], zipf_frequency: ZipfLookup) -> ZipfTable:
+    kept: List[str] = []
+    values: Dict[str, array] = {lang: array("H") for lang in LANGS}
+    for word in sorted(set(words)):
+        scores = [int(round(zipf_frequency(word, lang) * 100)) for lang in LANGS]
+        if not any(scores):
+            continue
+        kept.append(word)
+        for lang, score in zip(LANGS, scores):
+            values[lang].append(score)
+    return ZipfTable(kept, values)
+
+
+def main() -> None:
+    args = parse_args()
+    from wordfreq import zipf_frequency  # type: ignore
+
+    candidates = candidate_words(iter_texts(args.input_csv), args.max_group)
+    table = build_table(candidates, zipf_frequency)
+    table.save(args.out)
+
+    summary = {
+        "inputs": [str(path) for path in args.input_csv],
+        "max_group": args.max_group,
+        "candidates": len(candidates),
+        "words": len(table.words),
+        "bytes": args.out.stat().st_size,
+        "output": str(args.out),
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()